@@ -1,5 +1,6 @@
 __all__ = [
     "models",
+    "pipeline",
     "storage",
     "twitter",
 ]
\ No newline at end of file
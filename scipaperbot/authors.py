@@ -0,0 +1,38 @@
+import sys
+from typing import Dict, Iterable, List
+
+
+class AuthorTable:
+    """Author names interned to small integer IDs (index into ``names``)."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for n in names:
+            self.intern_id(n)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern_id(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def intern(self, name: str) -> str:
+        """The table's single shared copy of ``name``."""
+        return self.names[self.intern_id(name)]
+
+    def encode(self, authors: Iterable[str]) -> List[int]:
+        return [self.intern_id(a) for a in authors]
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        return [self.names[i] for i in ids]
+
+
+def intern_authors(names: Iterable[str]) -> List[str]:
+    # sys.intern shares one copy per distinct name and frees it once no paper
+    # refers to it, so long-running processes (--watch, the API server) do not grow
+    return [sys.intern(n) for n in names]
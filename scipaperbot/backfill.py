@@ -0,0 +1,205 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .enrich import enrich_from_config
+from .filtering import classify_pool, filter_papers_batch
+from .models import Paper
+from .query import compile_queries
+from .sources import SOURCE_NAMES, enabled_sources, source_fetcher
+from .storage import load_papers, merge_sorted, newest_first, save_papers
+
+
+# Days per chunk. bioRxiv/medRxiv return everything for a window (no keyword
+# query), so they get small chunks; keyword-queried sources can take a week.
+DEFAULT_CHUNK_DAYS: Dict[str, int] = {
+    "arxiv": 7,
+    "biorxiv": 1,
+    "medrxiv": 1,
+    "pubmed": 7,
+    "chemrxiv": 7,
+}
+
+# (max concurrent requests, min seconds between request starts) per API.
+# arXiv asks for one request every 3 seconds; NCBI allows 3/s without an API key.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+    "arxiv": (1, 3.0),
+    "biorxiv": (4, 0.25),
+    "medrxiv": (4, 0.25),
+    "pubmed": (3, 0.34),
+    "chemrxiv": (4, 0.1),
+}
+
+# Per-chunk result caps passed to the fetchers
+DEFAULT_MAX_RESULTS: Dict[str, int] = {
+    "arxiv": 1000,
+    "biorxiv": 5000,
+    "medrxiv": 5000,
+    "pubmed": 500,
+    "chemrxiv": 1000,
+}
+
+
+class RateLimiter:
+    """Thread-safe minimum spacing between calls."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def date_chunks(start: datetime, end: datetime, days: int) -> List[Tuple[datetime, datetime]]:
+    """Split [start, end] into consecutive windows of at most ``days`` days."""
+    chunks = []
+    step = timedelta(days=max(1, days))
+    cur = start
+    while cur <= end:
+        nxt = min(cur + step - timedelta(seconds=1), end)
+        chunks.append((cur, nxt))
+        cur = nxt + timedelta(seconds=1)
+    return chunks
+
+
+Range = Tuple[datetime, datetime]
+
+
+def split_range(start: datetime, end: datetime) -> Optional[Tuple[Range, Range]]:
+    """[start, end] halved on a day boundary, or None if it spans a single day."""
+    days = (end.date() - start.date()).days + 1
+    if days <= 1:
+        return None
+    mid = start.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=days // 2)
+    return (start, mid - timedelta(seconds=1)), (mid, end)
+
+
+def chunk_path(checkpoint_dir: str, source: str, start: datetime, end: datetime) -> str:
+    return os.path.join(checkpoint_dir, source, f"{start:%Y%m%d}-{end:%Y%m%d}.json")
+
+
+def _save_atomic(path: str, papers: List[Paper]) -> None:
+    tmp = path + ".tmp"
+    save_papers(tmp, papers, snapshot=False, compact=False)
+    os.replace(tmp, path)
+
+
+def run_backfill(
+    cfg: Dict,
+    start: datetime,
+    end: datetime,
+    sources: Optional[List[str]] = None,
+    checkpoint_dir: str = os.path.join("data", "backfill"),
+    retries: int = 2,
+) -> List[Paper]:
+    """Fetch [start, end] in per-source chunks, checkpointing each finished chunk.
+
+    Chunks that already have a checkpoint file are skipped, so an interrupted run
+    resumes where it stopped. Failed chunks are reported and left without a
+    checkpoint to be retried on the next run. Checkpoints hold filtered results,
+    so they live under a subdirectory named after the keyword config hash; a
+    changed keyword/exclude/required config starts from scratch. Returns the
+    deduplicated, filtered papers from every checkpoint in the range.
+    """
+    bf_cfg = cfg.get("backfill", {}) or {}
+    chunk_days = {**DEFAULT_CHUNK_DAYS, **(bf_cfg.get("chunk_days") or {})}
+    max_results = {**DEFAULT_MAX_RESULTS, **(bf_cfg.get("max_results") or {})}
+    rate_limits = dict(DEFAULT_RATE_LIMITS)
+    for name, rl in (bf_cfg.get("rate_limits") or {}).items():
+        rate_limits[name] = (int(rl.get("workers", 1)), float(rl.get("min_interval", 1.0)))
+
+    if sources is None:
+        sources = enabled_sources(cfg)
+    unknown = sorted(set(sources) - set(SOURCE_NAMES))
+    if unknown:
+        raise ValueError(f"unknown sources: {', '.join(unknown)}")
+
+    compiled = compile_queries(cfg)
+    checkpoint_dir = os.path.join(checkpoint_dir, compiled.config_hash)
+
+    def run_source(name: str) -> Tuple[int, int, int]:
+        workers, interval = rate_limits[name]
+        limiter = RateLimiter(interval)
+        # The fetcher waits on the limiter itself (before every request, for arXiv)
+        fetch = source_fetcher(name, cfg, max_results[name], limiter=limiter)
+        chunks = date_chunks(start, end, chunk_days[name])
+        pending = [c for c in chunks if not os.path.exists(chunk_path(checkpoint_dir, name, *c))]
+        os.makedirs(os.path.join(checkpoint_dir, name), exist_ok=True)
+        print(f"[{name}] {len(chunks)} chunks, {len(chunks) - len(pending)} already checkpointed")
+
+        def fetch_with_retries(s: datetime, e: datetime) -> List[Paper]:
+            for attempt in range(retries + 1):
+                try:
+                    return fetch(s, e)
+                except Exception as ex:
+                    if attempt == retries:
+                        raise
+                    print(f"[{name}] {s:%Y-%m-%d}..{e:%Y-%m-%d} attempt {attempt + 1} failed: {ex}; retrying")
+                    time.sleep(2 ** attempt)
+
+        def fetch_complete(s: datetime, e: datetime) -> List[Paper]:
+            # A capped result is truncated: split the range and fetch the halves instead
+            # of checkpointing a partial chunk that a resume would never revisit
+            raw = fetch_with_retries(s, e)
+            if len(raw) < max_results[name]:
+                return raw
+            halves = split_range(s, e)
+            if halves is None:
+                raise RuntimeError(
+                    f"{s:%Y-%m-%d} alone hit max_results={max_results[name]}; "
+                    f"raise backfill.max_results.{name} in config.yaml"
+                )
+            print(f"[{name}] {s:%Y-%m-%d}..{e:%Y-%m-%d} hit max_results={max_results[name]}; splitting")
+            merged: Dict[str, Paper] = {}
+            for hs, he in halves:
+                for p in fetch_complete(hs, he):
+                    merged.setdefault(p.id, p)
+            return list(merged.values())
+
+        def run_chunk(s: datetime, e: datetime) -> None:
+            raw = fetch_complete(s, e)
+            # Lookups share the source's rate limit (PubMed chunks hit NCBI EFetch), and a
+            # failed lookup fails the chunk so it is retried instead of checkpointed without abstracts
+            enrich_from_config(raw, cfg, limiter=limiter, raise_errors=True)
+            kept = filter_papers_batch(
+                raw, compiled.keywords, compiled.exclude_keywords, compiled.required_keywords, pool=pool
+            )
+            _save_atomic(chunk_path(checkpoint_dir, name, s, e), kept)
+
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            futures = {ex.submit(run_chunk, s, e): (s, e) for s, e in pending}
+            for fut in as_completed(futures):
+                s, e = futures[fut]
+                try:
+                    fut.result()
+                    done += 1
+                except Exception as err:
+                    failed += 1
+                    print(f"[WARN] {name} {s:%Y-%m-%d}..{e:%Y-%m-%d} failed: {err}")
+        return len(chunks), done, failed
+
+    # Sources are independent APIs, so run them side by side; every chunk's
+    # relevance filter runs in one shared process pool
+    with classify_pool(compiled.keywords, compiled.exclude_keywords, compiled.required_keywords) as pool:
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as ex:
+            stats = dict(zip(sources, ex.map(run_source, sources)))
+    for name, (total, done, failed) in stats.items():
+        print(f"[{name}] chunks={total} fetched_now={done} failed={failed}")
+
+    streams = [
+        newest_first(load_papers(chunk_path(checkpoint_dir, name, s, e)))
+        for name in sources
+        for s, e in date_chunks(start, end, chunk_days[name])
+    ]
+    return list(merge_sorted(streams))
@@ -0,0 +1,165 @@
+import base64
+import hashlib
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .filtering import filter_papers_batch
+from .models import Paper
+
+# Bump when the matching rules in filtering.py change so old decisions are dropped
+DECISION_VERSION = 1
+
+# Sentinel for "not in cache" (a cached rejection is stored as None)
+MISS = object()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 16-byte keys (already uniform hashes)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01, bits: Optional[bytearray] = None) -> None:
+        capacity = max(capacity, 1024)
+        self.m = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.m + 7) // 8)
+
+    def _positions(self, key: bytes):
+        # Double hashing from the two halves of the key
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        for i in range(self.k):
+            yield (h1 + i * h2) % self.m
+
+    def add(self, key: bytes) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+def decision_key(p: Paper) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{p.id}\0{p.title}\0{p.summary}".encode("utf-8"))
+    return h.digest()
+
+
+class DecisionCache:
+    """Relevance decisions for one compiled keyword config, persisted between runs.
+
+    One file per config hash under ``root`` maps a content key (hash of id,
+    title and summary) to ``[last_seen_day, keywords_matched or null]``.
+    A Bloom filter stored next to it answers "never seen" without reading the
+    entries, which are only parsed on the first probable hit. Entries not seen
+    for ``max_age_days`` are dropped on save, as are cache files of configs
+    that have not been used for that long.
+    """
+
+    def __init__(self, root: str, config_hash: str, max_age_days: float = 30) -> None:
+        self.root = root
+        self.max_age_days = max_age_days
+        base = os.path.join(root, f"{config_hash}-v{DECISION_VERSION}")
+        self.path = base + ".json"
+        self.bloom_path = base + ".bloom"
+        self._entries: Optional[Dict[str, list]] = None
+        self._dirty = False
+        self._today = int(time.time() // 86400)
+        try:
+            with open(self.bloom_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self.bloom: Optional[BloomFilter] = BloomFilter(
+                meta["capacity"], meta["error_rate"], bytearray(base64.b64decode(meta["bits"]))
+            )
+        except (FileNotFoundError, ValueError, KeyError):
+            self.bloom = None
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: bytes):
+        """Cached ``keywords_matched`` (None for a rejected paper), or ``MISS``."""
+        if self._entries is None and (self.bloom is None or key not in self.bloom):
+            return MISS
+        rec = self._load().get(key.hex())
+        if rec is None:
+            return MISS
+        if rec[0] != self._today:
+            rec[0] = self._today
+            self._dirty = True
+        return rec[1]
+
+    def put(self, key: bytes, matches: Optional[List[str]]) -> None:
+        self._load()[key.hex()] = [self._today, matches]
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        cutoff = self._today - self.max_age_days
+        entries = {k: v for k, v in self._load().items() if v[0] >= cutoff}
+        bloom = BloomFilter(len(entries) * 2)
+        for k in entries:
+            bloom.add(bytes.fromhex(k))
+
+        os.makedirs(self.root, exist_ok=True)
+        for path, body in (
+            (self.path, entries),
+            (
+                self.bloom_path,
+                {"capacity": len(entries) * 2, "error_rate": 0.01, "bits": base64.b64encode(bloom.bits).decode()},
+            ),
+        ):
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(body, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        self._entries, self.bloom, self._dirty = entries, bloom, False
+
+        # Caches of configs that are no longer in use
+        stale = time.time() - self.max_age_days * 86400
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if path not in (self.path, self.bloom_path) and os.path.getmtime(path) < stale:
+                os.remove(path)
+
+
+def filter_papers_cached(
+    papers: Sequence[Paper],
+    keywords: Sequence[str],
+    exclude_keywords: Sequence[str],
+    required_keywords: Sequence[str],
+    cache: DecisionCache,
+) -> List[Paper]:
+    """``filter_papers_batch`` that only classifies papers the cache has not seen."""
+    keys = [decision_key(p) for p in papers]
+    decided: Dict[bytes, Optional[List[str]]] = {}
+    misses = []
+    for p, key in zip(papers, keys):
+        hit = cache.get(key)
+        if hit is MISS:
+            misses.append((p, key))
+        else:
+            decided[key] = hit
+
+    batch = [p for p, _ in misses]
+    # By object, not ID: records that share an ID can get different decisions
+    kept = {id(p) for p in filter_papers_batch(batch, keywords, exclude_keywords, required_keywords)}
+    for p, key in misses:
+        decided[key] = list(p.keywords_matched) if id(p) in kept else None
+        cache.put(key, decided[key])
+    cache.save()
+
+    filtered = []
+    for p, key in zip(papers, keys):
+        if decided[key]:
+            p.keywords_matched = list(decided[key])
+            filtered.append(p)
+    return filtered
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from .models import Paper
+
+FEED_MAX_ITEMS = 100
+
+
+def paper_hash(p: Paper) -> str:
+    """Stable content hash of a paper.
+
+    ``score`` is left out: it is re-derived from the whole batch on every run and
+    would otherwise mark unchanged papers as updated.
+    """
+    d = p.to_dict()
+    d.pop("score", None)
+    raw = json.dumps(d, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def dataset_hash(hashes: Dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for pid in sorted(hashes):
+        h.update(f"{pid}\t{hashes[pid]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def compute_delta(previous: Sequence[Paper], current: Sequence[Paper]) -> Dict:
+    """Added, updated and removed IDs between two builds."""
+    old = {p.id: paper_hash(p) for p in previous}
+    new = {p.id: paper_hash(p) for p in current}
+    return {
+        "added": sorted(pid for pid in new if pid not in old),
+        "updated": sorted(pid for pid in new if pid in old and old[pid] != new[pid]),
+        "removed": sorted(pid for pid in old if pid not in new),
+        "dataset_hash": dataset_hash(new),
+        "previous_dataset_hash": dataset_hash(old),
+    }
+
+
+def write_delta(path: str, delta: Dict, generated: Optional[datetime] = None) -> None:
+    generated = generated or datetime.now(timezone.utc)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"generated": generated.isoformat(), **delta}, f, ensure_ascii=False, indent=2)
+
+
+def _feed_item(p: Paper, modified: datetime) -> Dict:
+    return {
+        "id": p.id,
+        "url": p.link,
+        "title": p.title,
+        "content_text": p.summary or p.title,
+        "date_published": p.published.replace(tzinfo=timezone.utc).isoformat(),
+        "date_modified": modified.isoformat(),
+        "authors": [{"name": a} for a in p.authors],
+        "tags": [p.source] + p.categories,
+    }
+
+
+def update_json_feed(
+    path: str,
+    papers: Sequence[Paper],
+    delta: Dict,
+    title: str = "Aging & DDR Papers",
+    home_page_url: Optional[str] = None,
+    max_items: int = FEED_MAX_ITEMS,
+    generated: Optional[datetime] = None,
+) -> int:
+    """Prepend this build's added/updated papers to a JSON Feed (v1.1) at ``path``.
+
+    Items from earlier builds are kept (newest change first, capped at
+    ``max_items``) so readers polling less often than we build do not miss
+    anything. Returns the number of items added or refreshed.
+    """
+    generated = generated or datetime.now(timezone.utc)
+    changed = set(delta["added"]) | set(delta["updated"])
+    fresh = [_feed_item(p, generated) for p in papers if p.id in changed]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            old_items: List[Dict] = json.load(f).get("items", [])
+    except (FileNotFoundError, ValueError):
+        old_items = []
+    items = fresh + [it for it in old_items if it.get("id") not in changed]
+    items.sort(key=lambda it: (it.get("date_modified", ""), it.get("date_published", "")), reverse=True)
+
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": title,
+        "items": items[:max_items],
+    }
+    if home_page_url:
+        feed["home_page_url"] = home_page_url
+        feed["feed_url"] = home_page_url.rstrip("/") + "/data/" + os.path.basename(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(feed, f, ensure_ascii=False, indent=2)
+    return len(fresh)
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import Paper
+from .xmlstream import iter_elements
+
+EUTILS = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+EUROPEPMC = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+HEADERS = {"User-Agent": "Aging-DDR-bot/1.0"}
+
+_TAG = re.compile(r"<[^>]+>")
+_WS = re.compile(r"\s+")
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Canonical DOI form: lowercase, no ``doi:``/resolver prefix."""
+    if not doi:
+        return None
+    d = doi.strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:"):
+        if d.startswith(prefix):
+            d = d[len(prefix) :].strip()
+    return d if d.startswith("10.") else None
+
+
+def clean_text(s: str) -> str:
+    """Strip JATS/HTML tags and collapse whitespace."""
+    return _WS.sub(" ", _TAG.sub(" ", s or "")).strip()
+
+
+def cache_key(p: Paper) -> Optional[str]:
+    doi = normalize_doi(p.doi)
+    if doi:
+        return f"doi:{doi}"
+    if p.id.startswith("pmid:"):
+        return p.id
+    return None
+
+
+class EnrichmentCache:
+    """Content-addressed on-disk cache: one small JSON file per normalized DOI/PMID key."""
+
+    def __init__(self, root: str, ttl_days: float = 365, negative_ttl_days: float = 30) -> None:
+        self.root = root
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_days * 86400
+
+    def _path(self, key: str) -> str:
+        h = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, h[:2], f"{h}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                rec = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        # Misses ("nothing found upstream") expire sooner so they get retried
+        ttl = self.ttl if rec.get("summary") else self.negative_ttl
+        if time.time() - rec.get("fetched_at", 0) > ttl:
+            return None
+        return rec
+
+    def put(self, key: str, rec: Dict) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({**rec, "key": key, "fetched_at": time.time()}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+def _fetch_pubmed_batch(pmids: Sequence[str], email: Optional[str] = None) -> Dict[str, Dict]:
+    import requests
+
+    params = {"db": "pubmed", "retmode": "xml", "id": ",".join(pmids)}
+    if email:
+        params["email"] = email
+    r = requests.post(f"{EUTILS}/efetch.fcgi", data=params, headers=HEADERS, timeout=60)
+    r.raise_for_status()
+    out: Dict[str, Dict] = {}
+    for art in iter_elements(r.content, "PubmedArticle"):
+        pmid = art.findtext("MedlineCitation/PMID")
+        if not pmid:
+            continue
+        parts = []
+        for ab in art.iterfind("MedlineCitation/Article/Abstract/AbstractText"):
+            text = clean_text("".join(ab.itertext()))
+            label = ab.get("Label")
+            if text:
+                parts.append(f"{label}: {text}" if label else text)
+        doi = None
+        for aid in art.iterfind("PubmedData/ArticleIdList/ArticleId"):
+            if aid.get("IdType") == "doi" and aid.text:
+                doi = normalize_doi(aid.text)
+        out[pmid] = {"summary": " ".join(parts), "doi": doi}
+    return out
+
+
+def _fetch_europepmc_batch(dois: Sequence[str]) -> Dict[str, Dict]:
+    import requests
+
+    query = " OR ".join(f'DOI:"{d}"' for d in dois)
+    params = {"query": query, "resultType": "core", "format": "json", "pageSize": str(max(25, len(dois) * 2))}
+    r = requests.get(EUROPEPMC, params=params, headers=HEADERS, timeout=60)
+    r.raise_for_status()
+    out: Dict[str, Dict] = {}
+    for res in r.json().get("resultList", {}).get("result", []):
+        doi = normalize_doi(res.get("doi"))
+        summary = clean_text(res.get("abstractText", ""))
+        if doi and summary and doi not in out:
+            out[doi] = {"summary": summary, "doi": doi}
+    return out
+
+
+def enrich_papers(
+    papers: Sequence[Paper],
+    cache_dir: str = os.path.join("data", "enrich_cache"),
+    ttl_days: float = 365,
+    email: Optional[str] = None,
+    max_workers: int = 3,
+    batch_size: int = 50,
+    limiter=None,
+    raise_errors: bool = False,
+) -> int:
+    """Fill missing abstracts (and DOIs) in place; returns how many papers gained a summary.
+
+    Papers without a summary are looked up in the cache first. Misses are fetched
+    in concurrent batches (PubMed EFetch by PMID, Europe PMC by DOI) and every
+    looked-up key is written back, including misses, so each paper costs at most
+    one upstream lookup per TTL.
+
+    ``limiter`` (anything with a ``wait()`` method, e.g. the backfill
+    ``RateLimiter``) is waited on before every batch request. A failed batch is
+    logged and skipped unless ``raise_errors`` is set.
+    """
+    cache = EnrichmentCache(cache_dir, ttl_days=ttl_days)
+    todo: Dict[str, List[Paper]] = {}
+    for p in papers:
+        if p.summary:
+            continue
+        key = cache_key(p)
+        if key:
+            todo.setdefault(key, []).append(p)
+
+    found: Dict[str, Dict] = {}
+    missing: List[str] = []
+    for key in todo:
+        rec = cache.get(key)
+        if rec is not None:
+            found[key] = rec
+        else:
+            missing.append(key)
+
+    # PubMed records go through EFetch by PMID, everything else through Europe PMC by DOI
+    pmids: List[Tuple[str, str]] = []
+    dois: List[Tuple[str, str]] = []
+    for key in missing:
+        pmid = next((p.id[len("pmid:") :] for p in todo[key] if p.id.startswith("pmid:")), None)
+        if pmid:
+            pmids.append((pmid, key))
+        elif key.startswith("doi:"):
+            dois.append((key[len("doi:") :], key))
+
+    def call(fn, *args):
+        if limiter is not None:
+            limiter.wait()
+        return fn(*args)
+
+    jobs = {}
+    fetched: Dict[str, Dict] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as ex:
+        for i in range(0, len(pmids), 200):
+            batch = pmids[i : i + 200]
+            jobs[ex.submit(call, _fetch_pubmed_batch, [x for x, _ in batch], email)] = batch
+        for i in range(0, len(dois), batch_size):
+            batch = dois[i : i + batch_size]
+            jobs[ex.submit(call, _fetch_europepmc_batch, [x for x, _ in batch])] = batch
+        for job, batch in jobs.items():
+            try:
+                res = job.result()
+            except Exception as e:
+                if raise_errors:
+                    raise
+                print(f"[WARN] enrichment batch of {len(batch)} failed: {e}")
+                continue
+            # Cache every key of a successful batch, misses included
+            for lookup, key in batch:
+                rec = res.get(lookup) or {"summary": "", "doi": None}
+                cache.put(key, rec)
+                if rec.get("doi") and not key.startswith("doi:"):
+                    # Later runs will see this paper by its DOI
+                    cache.put(f"doi:{rec['doi']}", rec)
+                fetched[key] = rec
+    found.update(fetched)
+
+    enriched = 0
+    for key, group in todo.items():
+        rec = found.get(key)
+        if not rec or not rec.get("summary"):
+            continue
+        for p in group:
+            p.summary = rec["summary"]
+            if not p.doi and rec.get("doi"):
+                p.doi = rec["doi"]
+            enriched += 1
+    return enriched
+
+
+def enrich_from_config(papers: Sequence[Paper], cfg: Dict, limiter=None, raise_errors: bool = False) -> int:
+    """Run ``enrich_papers`` with the ``enrichment`` section of config.yaml (0 if disabled)."""
+    enrich_cfg = cfg.get("enrichment", {}) or {}
+    if not enrich_cfg.get("enabled", True):
+        return 0
+    return enrich_papers(
+        papers,
+        cache_dir=enrich_cfg.get("cache_dir", os.path.join("data", "enrich_cache")),
+        ttl_days=float(enrich_cfg.get("ttl_days", 365)),
+        email=cfg.get("sources", {}).get("pubmed", {}).get("email"),
+        limiter=limiter,
+        raise_errors=raise_errors,
+    )
@@ -1,23 +1,39 @@
-from datetime import datetime, timezone
+import time
+from datetime import datetime
 from typing import List, Optional
 
-import feedparser
 import requests
 
 from ..models import Paper
+from ..xmlstream import parse_arxiv_feed
 
 
-def _build_query(keywords: List[str], categories: Optional[List[str]]) -> str:
+def _build_query(
+    keywords: List[str],
+    categories: Optional[List[str]],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    keyword_clause: Optional[str] = None,
+) -> str:
     terms = []
-    if keywords:
+    if keyword_clause:
+        # Pre-compiled by scipaperbot.query (aliases, required, exclude)
+        terms.append(f"({keyword_clause})")
+    elif keywords:
         kw_query = " OR ".join([f'(ti:"{k}" OR abs:"{k}")' for k in keywords])
         terms.append(f"({kw_query})")
     if categories:
         cat_query = " OR ".join([f"cat:{c}" for c in categories])
         terms.append(f"({cat_query})")
+    if start_date and end_date:
+        # Server-side date window so older ranges (e.g. backfills) are reachable
+        terms.append(f"submittedDate:[{start_date:%Y%m%d%H%M} TO {end_date:%Y%m%d%H%M}]")
     return " AND ".join(terms) if terms else "all:biology"
 
 
+# arXiv asks for at least 3 seconds between API requests
+REQUEST_INTERVAL = 3.0
+
 essential_headers = {"User-Agent": "Aging-DDR-bot/1.0 (+https://github.com/KrnGitlin/Aging-DDR-papers-bot)"}
 
 
@@ -27,50 +43,44 @@ def fetch_arxiv(
     end_date: datetime,
     max_results: int = 100,
     categories: Optional[List[str]] = None,
+    session: Optional[requests.Session] = None,
+    queries: Optional[List[str]] = None,
+    limiter=None,
 ) -> List[Paper]:
+    """Fetch recent arXiv entries.
+
+    ``queries`` are keyword clauses from ``scipaperbot.query``; one request is
+    made per clause (long keyword lists are split to stay under URL limits)
+    and results are merged up to ``max_results``. Requests are spaced by
+    ``REQUEST_INTERVAL``, or by waiting on ``limiter`` (anything with a
+    ``wait()`` method) before each one when it is given.
+    """
     categories = categories or ["q-bio*", "cs.CB"]
-    search_query = _build_query(keywords, categories)
+    clauses = queries or [None]
 
     url = "https://export.arxiv.org/api/query"
-    params = {
-        "search_query": search_query,
-        "sortBy": "submittedDate",
-        "sortOrder": "descending",
-        "start": 0,
-        "max_results": max_results,
-    }
-
-    r = requests.get(url, params=params, headers=essential_headers, timeout=30)
-    r.raise_for_status()
-
-    feed = feedparser.parse(r.text)
     papers: List[Paper] = []
-    for e in feed.entries:
-        pub = (
-            datetime(*e.published_parsed[:6], tzinfo=timezone.utc)
-            if getattr(e, "published_parsed", None)
-            else datetime.now(timezone.utc)
-        )
-        if pub < start_date or pub > end_date:
-            continue
-        link = getattr(e, "link", "")
-        authors = [a.name for a in getattr(e, "authors", [])]
-        cats = [t.term for t in getattr(e, "tags", [])]
-        pid = getattr(e, "id", link)
-
-        papers.append(
-            Paper(
-                id=pid,
-                title=e.title,
-                authors=authors,
-                summary=getattr(e, "summary", ""),
-                published=pub,
-                updated=None,
-                source="arXiv",
-                link=link,
-                doi=None,
-                categories=cats,
-            )
-        )
+    seen = set()
+    for i, clause in enumerate(clauses):
+        if limiter is not None:
+            limiter.wait()
+        elif i:
+            time.sleep(REQUEST_INTERVAL)
+        params = {
+            "search_query": _build_query(keywords, categories, start_date, end_date, clause),
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+            "start": 0,
+            "max_results": max_results,
+        }
+        r = (session or requests).get(url, params=params, headers=essential_headers, timeout=30)
+        r.raise_for_status()
+        # Streaming Atom parser; only the fields we keep are extracted
+        for p in parse_arxiv_feed(r.content):
+            if p.id in seen or p.published < start_date or p.published > end_date:
+                continue
+            seen.add(p.id)
+            papers.append(p)
 
-    return papers
+    papers.sort(key=lambda p: p.published, reverse=True)
+    return papers[:max_results]
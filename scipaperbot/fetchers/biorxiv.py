@@ -1,15 +1,22 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 import requests
 
 from ..models import Paper
 
 
-def fetch_rxiv(server: str, start_date: datetime, end_date: datetime, max_results: int = 1000) -> List[Paper]:
+def fetch_rxiv(
+    server: str,
+    start_date: datetime,
+    end_date: datetime,
+    max_results: int = 1000,
+    session: Optional[requests.Session] = None,
+) -> List[Paper]:
     """Fetch from bioRxiv or medRxiv via api.biorxiv.org.
 
     server: 'biorxiv' or 'medrxiv'
+    session: optional requests.Session to reuse connections across calls
     """
     s = start_date.strftime("%Y-%m-%d")
     e = end_date.strftime("%Y-%m-%d")
@@ -18,10 +25,11 @@ def fetch_rxiv(server: str, start_date: datetime, end_date: datetime, max_result
     size = 100
     results: List[Paper] = []
     headers = {"User-Agent": "Aging-DDR-bot/1.0"}
+    http = session or requests
 
     while True:
         url = f"{base}/{cursor}"
-        r = requests.get(url, headers=headers, timeout=30)
+        r = http.get(url, headers=headers, timeout=30)
         r.raise_for_status()
         js = r.json()
         collection = js.get("collection", [])
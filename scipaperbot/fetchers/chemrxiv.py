@@ -1,24 +1,46 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import Callable, List, Optional
 
 import requests
 
 from ..models import Paper
 
 
-def fetch_chemrxiv(keywords: List[str], start_date: datetime, end_date: datetime, max_results: int = 100) -> List[Paper]:
+def fetch_chemrxiv(
+    keywords: List[str],
+    start_date: datetime,
+    end_date: datetime,
+    max_results: int = 100,
+    session: Optional[requests.Session] = None,
+    bibliographic: Optional[List[str]] = None,
+    matcher: Optional[Callable[[str], bool]] = None,
+) -> List[Paper]:
+    """Fetch ChemRxiv posted content from Crossref.
+
+    ``bibliographic`` are ``query.bibliographic`` strings from
+    ``scipaperbot.query`` so Crossref only returns works mentioning the
+    keywords; ``matcher`` replaces the plain substring check on title/abstract.
+    """
     url = "https://api.crossref.org/works"
-    params = {
-        "filter": f"from-pub-date:{start_date:%Y-%m-%d},until-pub-date:{end_date:%Y-%m-%d},prefix:10.26434,type:posted-content",
-        "rows": str(max_results),
-        "sort": "issued",
-        "order": "desc",
-    }
     headers = {"User-Agent": "Aging-DDR-bot/1.0"}
-
-    r = requests.get(url, params=params, headers=headers, timeout=30)
-    r.raise_for_status()
-    items = r.json().get("message", {}).get("items", [])
+    items = []
+    seen = set()
+    for bib in bibliographic or [None]:
+        params = {
+            "filter": f"from-pub-date:{start_date:%Y-%m-%d},until-pub-date:{end_date:%Y-%m-%d},prefix:10.26434,type:posted-content",
+            "rows": str(max_results),
+            "sort": "issued",
+            "order": "desc",
+        }
+        if bib:
+            params["query.bibliographic"] = bib
+        r = (session or requests).get(url, params=params, headers=headers, timeout=30)
+        r.raise_for_status()
+        for it in r.json().get("message", {}).get("items", []):
+            key = it.get("DOI") or it.get("URL")
+            if key not in seen:
+                seen.add(key)
+                items.append(it)
 
     papers: List[Paper] = []
     lower_keywords = [k.lower() for k in keywords]
@@ -26,8 +48,11 @@ def fetch_chemrxiv(keywords: List[str], start_date: datetime, end_date: datetime
     for it in items:
         title = " ".join(it.get("title", []))
         abstract = it.get("abstract", "")
-        text = f"{title}\n{abstract}".lower()
-        if lower_keywords and not any(k in text for k in lower_keywords):
+        text = f"{title}\n{abstract}"
+        if matcher is not None:
+            if not matcher(text):
+                continue
+        elif lower_keywords and not any(k in text.lower() for k in lower_keywords):
             continue
 
         issued = it.get("issued", {}).get("date-parts", [[datetime.now().year, 1, 1]])[0]
@@ -60,4 +85,5 @@ def fetch_chemrxiv(keywords: List[str], start_date: datetime, end_date: datetime
             )
         )
 
-    return papers
+    papers.sort(key=lambda p: p.published, reverse=True)
+    return papers[:max_results]
@@ -1,10 +1,17 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+
+import requests
 
 from .biorxiv import fetch_rxiv
 from ..models import Paper
 
 
-def fetch_medrxiv(start_date: datetime, end_date: datetime, max_results: int = 1000) -> List[Paper]:
+def fetch_medrxiv(
+    start_date: datetime,
+    end_date: datetime,
+    max_results: int = 1000,
+    session: Optional[requests.Session] = None,
+) -> List[Paper]:
     """Thin wrapper for medRxiv using the bioRxiv API server switch."""
-    return fetch_rxiv("medrxiv", start_date, end_date, max_results)
+    return fetch_rxiv("medrxiv", start_date, end_date, max_results, session)
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timezone
 from typing import List, Optional
 
@@ -7,6 +8,9 @@ from ..models import Paper
 
 BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 
+# NCBI allows 3 E-utilities requests per second without an API key
+REQUEST_INTERVAL = 0.34
+
 
 def fetch_pubmed(
     keywords: List[str],
@@ -14,25 +18,52 @@ def fetch_pubmed(
     end_date: datetime,
     max_results: int = 100,
     email: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    terms: Optional[List[str]] = None,
+    limiter=None,
 ) -> List[Paper]:
-    term_parts = []
-    for k in keywords:
-        term_parts.append(f"({k}[Title/Abstract])")
-    term = " OR ".join(term_parts) if term_parts else "biology[Title/Abstract]"
-    date_range = f'("{start_date:%Y/%m/%d}"[Date - Publication] : "{end_date:%Y/%m/%d}"[Date - Publication])'
-    query = f"({term}) AND {date_range}"
+    """Search PubMed and summarize the hits.
+
+    ``terms`` are pre-compiled search terms from ``scipaperbot.query``; each is
+    searched separately and the PMIDs are merged (up to ``max_results``).
+    E-utilities requests are spaced by ``REQUEST_INTERVAL``, or by waiting on
+    ``limiter`` (anything with a ``wait()`` method) before each one.
+    """
+    sent = 0
 
-    params = {"db": "pubmed", "retmode": "json", "retmax": str(max_results), "term": query}
-    if email:
-        params["email"] = email
+    def pace() -> None:
+        nonlocal sent
+        if limiter is not None:
+            limiter.wait()
+        elif sent:
+            time.sleep(REQUEST_INTERVAL)
+        sent += 1
+
+    if not terms:
+        term_parts = []
+        for k in keywords:
+            term_parts.append(f"({k}[Title/Abstract])")
+        terms = [" OR ".join(term_parts) if term_parts else "biology[Title/Abstract]"]
+    date_range = f'("{start_date:%Y/%m/%d}"[Date - Publication] : "{end_date:%Y/%m/%d}"[Date - Publication])'
 
-    r = requests.get(f"{BASE}/esearch.fcgi", params=params, timeout=30)
-    r.raise_for_status()
-    ids = r.json().get("esearchresult", {}).get("idlist", [])
+    http = session or requests
+    ids: List[str] = []
+    for term in terms:
+        params = {"db": "pubmed", "retmode": "json", "retmax": str(max_results), "term": f"({term}) AND {date_range}"}
+        if email:
+            params["email"] = email
+        pace()
+        r = http.get(f"{BASE}/esearch.fcgi", params=params, timeout=30)
+        r.raise_for_status()
+        for pid in r.json().get("esearchresult", {}).get("idlist", []):
+            if pid not in ids:
+                ids.append(pid)
+    ids = ids[:max_results]
     if not ids:
         return []
 
-    summary = requests.get(
+    pace()
+    summary = http.get(
         f"{BASE}/esummary.fcgi", params={"db": "pubmed", "retmode": "json", "id": ",".join(ids)}, timeout=30
     )
     summary.raise_for_status()
@@ -0,0 +1,198 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Paper
+
+
+BIO_HEURISTIC = re.compile(
+    r"\b(cell|cells|mouse|mice|human|patient|tissue|protein|gene|genomic|rna|dna|biolog|organism|yeast|zebrafish)\b",
+    re.I,
+)
+
+
+def compile_keyword_regex(keywords: List[str]) -> List[re.Pattern]:
+    # word-boundary-ish regexes; allow hyphenation and plural forms where sensible
+    patterns = []
+    for k in keywords:
+        k = k.strip()
+        if not k:
+            continue
+        esc = re.escape(k)
+        # allow minor variations for certain base terms
+        if k.lower() in {"aging", "ageing"}:
+            # Match both spellings: aging and ageing
+            patterns.append(re.compile(r"\b(?:aging|ageing)\b", re.I))
+        elif k.lower() == "ddr":
+            patterns.append(re.compile(r"\b(?:ddr|dna\s+damage\s+response)\b", re.I))
+        elif k.lower().startswith("dna damage"):
+            patterns.append(re.compile(r"\bdna\s+damage(?:\s+response)?\b", re.I))
+        else:
+            patterns.append(re.compile(rf"\b{esc}\b", re.I))
+    # Aliases can map onto the same pattern (aging/ageing); keep the first
+    unique: Dict[str, re.Pattern] = {}
+    for rx in patterns:
+        unique.setdefault(rx.pattern, rx)
+    return list(unique.values())
+
+
+def find_matches(text: str, patterns: List[re.Pattern]) -> List[str]:
+    found = []
+    for rx in patterns:
+        if rx.search(text):
+            found.append(rx.pattern)
+    return found
+
+
+def classify(
+    text: str,
+    kw_regex: List[re.Pattern],
+    excl_regex: List[re.Pattern],
+    req_regex: List[re.Pattern],
+) -> Optional[List[str]]:
+    """Return the matched keyword patterns if ``text`` is relevant, else None."""
+    # Exclude if any exclude keyword matches
+    if excl_regex and find_matches(text, excl_regex):
+        return None
+    # If required keywords present, require at least one match
+    if req_regex and not find_matches(text, req_regex):
+        return None
+    # Finally require at least one general keyword
+    matches = find_matches(text, kw_regex)
+    return matches or None
+
+
+def filter_papers(
+    papers: Iterable[Paper],
+    kw_regex: List[re.Pattern],
+    excl_regex: List[re.Pattern],
+    req_regex: List[re.Pattern],
+) -> List[Paper]:
+    """Keyword relevance filter with optional exclude/required logic (Scitify-like).
+
+    Sets ``keywords_matched`` on every paper that is kept.
+    """
+    filtered = []
+    for p in papers:
+        matches = classify(f"{p.title}\n{p.summary}", kw_regex, excl_regex, req_regex)
+        if matches:
+            p.keywords_matched = matches
+            filtered.append(p)
+    return filtered
+
+
+# Below this many records a process pool costs more than it saves
+PARALLEL_MIN_BATCH = 5000
+
+# Patterns compiled once per worker process by _init_worker
+_worker_patterns: Optional[Tuple[List[re.Pattern], List[re.Pattern], List[re.Pattern]]] = None
+
+
+def _compile_all(
+    keywords: Sequence[str], exclude_keywords: Sequence[str], required_keywords: Sequence[str]
+) -> Tuple[List[re.Pattern], List[re.Pattern], List[re.Pattern]]:
+    return (
+        compile_keyword_regex(list(keywords)),
+        compile_keyword_regex(list(exclude_keywords)),
+        compile_keyword_regex(list(required_keywords)),
+    )
+
+
+def _init_worker(keywords: Sequence[str], exclude_keywords: Sequence[str], required_keywords: Sequence[str]) -> None:
+    global _worker_patterns
+    _worker_patterns = _compile_all(keywords, exclude_keywords, required_keywords)
+
+
+def _classify_records(
+    chunk: Sequence[Tuple[Hashable, str, str]],
+    patterns: Tuple[List[re.Pattern], List[re.Pattern], List[re.Pattern]],
+) -> List[Tuple[Hashable, List[str]]]:
+    kw_regex, excl_regex, req_regex = patterns
+    out = []
+    for key, title, summary in chunk:
+        matches = classify(f"{title}\n{summary}", kw_regex, excl_regex, req_regex)
+        if matches:
+            out.append((key, matches))
+    return out
+
+
+def _classify_chunk(chunk: List[Tuple[Hashable, str, str]]) -> List[Tuple[Hashable, List[str]]]:
+    return _classify_records(chunk, _worker_patterns)
+
+
+def classify_pool(
+    keywords: Sequence[str],
+    exclude_keywords: Sequence[str] = (),
+    required_keywords: Sequence[str] = (),
+    workers: Optional[int] = None,
+) -> ProcessPoolExecutor:
+    """A process pool whose workers have the patterns compiled, for ``classify_batch(pool=...)``.
+
+    Lets many smaller batches (e.g. backfill chunks) share one set of workers.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        initializer=_init_worker,
+        initargs=(list(keywords), list(exclude_keywords), list(required_keywords)),
+    )
+
+
+def classify_batch(
+    records: Sequence[Tuple[Hashable, str, str]],
+    keywords: Sequence[str],
+    exclude_keywords: Sequence[str] = (),
+    required_keywords: Sequence[str] = (),
+    workers: Optional[int] = None,
+    chunk_size: int = 2000,
+    min_parallel: int = PARALLEL_MIN_BATCH,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Dict[Hashable, List[str]]:
+    """Classify ``(key, title, summary)`` records, returning ``keywords_matched`` per kept key.
+
+    The key is usually the paper ID; it must be unique within ``records``.
+    Regex matching is CPU-bound, so large batches are split into chunks and sent
+    to a process pool whose workers compile the patterns once. Batches smaller
+    than ``min_parallel`` (or ``workers=1``) are classified in-process, unless
+    a ``pool`` from ``classify_pool`` is passed, which is used for any size.
+    """
+    workers = workers or os.cpu_count() or 1
+    if pool is None and (workers <= 1 or len(records) < min_parallel):
+        return dict(_classify_records(records, _compile_all(keywords, exclude_keywords, required_keywords)))
+
+    chunks = [list(records[i : i + chunk_size]) for i in range(0, len(records), chunk_size)]
+    result: Dict[Hashable, List[str]] = {}
+    if pool is not None:
+        for part in pool.map(_classify_chunk, chunks):
+            result.update(part)
+        return result
+    with classify_pool(keywords, exclude_keywords, required_keywords, min(workers, len(chunks))) as ex:
+        for part in ex.map(_classify_chunk, chunks):
+            result.update(part)
+    return result
+
+
+def filter_papers_batch(
+    papers: Sequence[Paper],
+    keywords: Sequence[str],
+    exclude_keywords: Sequence[str] = (),
+    required_keywords: Sequence[str] = (),
+    workers: Optional[int] = None,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> List[Paper]:
+    """Same result as ``filter_papers`` but classified through ``classify_batch``."""
+    # Keyed by position: records can share an ID (e.g. bioRxiv versions of one DOI)
+    matched = classify_batch(
+        [(i, p.title, p.summary) for i, p in enumerate(papers)],
+        keywords,
+        exclude_keywords,
+        required_keywords,
+        workers=workers,
+        pool=pool,
+    )
+    filtered = []
+    for i, p in enumerate(papers):
+        if i in matched:
+            p.keywords_matched = matched[i]
+            filtered.append(p)
+    return filtered
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
+from .authors import intern_authors
+
 
 @dataclass
 class Paper:
@@ -16,6 +18,11 @@ class Paper:
     doi: Optional[str] = None
     categories: List[str] = field(default_factory=list)
     keywords_matched: List[str] = field(default_factory=list)
+    score: float = 0.0
+
+    def __post_init__(self) -> None:
+        # Share one string per distinct author across all papers
+        self.authors = intern_authors(self.authors)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -30,6 +37,7 @@ class Paper:
             "doi": self.doi,
             "categories": self.categories,
             "keywords_matched": self.keywords_matched,
+            "score": self.score,
         }
 
     @staticmethod
@@ -55,4 +63,5 @@ class Paper:
             doi=d.get("doi"),
             categories=d.get("categories", []),
             keywords_matched=d.get("keywords_matched", []),
+            score=float(d.get("score") or 0.0),
         )
@@ -0,0 +1,329 @@
+"""Programmatic API for the paper pipeline.
+
+``run(config)`` fetches, enriches, filters and de-duplicates papers and
+yields them newest first; nothing is written unless sinks are passed. The
+stream starts once the batch has been fetched and de-duplicated.
+Every stage can be replaced:
+
+- ``fetch(cfg) -> Iterable[Paper]``: raw papers (default: every enabled source)
+- ``filter(papers, cfg) -> List[Paper]``: relevance filter (default: ``select_relevant``)
+- ``dedupe(papers) -> List[Paper]``: default ``dedupe_and_sort``
+- ``sinks``: callables ``sink(papers, cfg)`` run on the final list, e.g. ``publish``
+
+Example::
+
+    from scipaperbot import pipeline
+
+    for paper in pipeline.run("config.yaml"):
+        print(paper.published, paper.title)
+
+``scripts/update_papers.py`` is ``run_profiles(cfg, sinks=[publish])``.
+"""
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .decisions import DecisionCache, filter_papers_cached
+from .delta import compute_delta, paper_hash, update_json_feed, write_delta
+from .enrich import enrich_from_config
+from .filtering import filter_papers_batch
+from .models import Paper
+from .profiles import DEFAULT_PROFILE, fan_out, fetch_config, output_paths, profile_configs
+from .query import compile_queries
+from .scoring import score_papers
+from .sitebuild import build_site
+from .sources import SOURCE_LABELS, SOURCE_NAMES, enabled_sources, source_fetcher
+from .storage import append_to_archive, dedupe_and_sort, iter_archive, iter_papers, merge_sorted, save_papers
+
+Fetch = Callable[[Dict], Iterable[Paper]]
+Filter = Callable[[List[Paper], Dict], List[Paper]]
+Dedupe = Callable[[List[Paper]], List[Paper]]
+Sink = Callable[[List[Paper], Dict], object]
+
+# Default polling interval per source in watch mode
+DEFAULT_WATCH_MINUTES = {"arxiv": 60, "biorxiv": 120, "medrxiv": 120, "pubmed": 180, "chemrxiv": 240}
+
+
+def load_config(config: Union[str, Dict]) -> Dict:
+    """A config dict, or the parsed YAML file at ``config``."""
+    if isinstance(config, dict):
+        return config
+    import yaml
+
+    with open(config, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def fetch_source(name: str, cfg: Dict, start: datetime, end: datetime, session=None) -> List[Paper]:
+    try:
+        return source_fetcher(name, cfg, session=session)(start, end)
+    except Exception as e:
+        print(f"[WARN] {SOURCE_LABELS[name]} failed: {e}")
+        return []
+
+
+def enrich(papers: List[Paper], cfg: Dict) -> None:
+    # Fill missing abstracts (PubMed, ChemRxiv) before filtering so keywords see them
+    enriched = enrich_from_config(papers, cfg)
+    if enriched:
+        print(f"Enriched {enriched} papers with missing abstracts")
+
+
+def select_relevant(papers: List[Paper], cfg: Dict) -> List[Paper]:
+    # Filter for relevance by keywords with optional exclude/required logic (Scitify-like)
+    # (large batches are classified in a process pool)
+    # Keywords are alias-expanded by the query compiler, same as the source queries
+    compiled = compile_queries(cfg)
+    dc_cfg = cfg.get("decision_cache") or {}
+    if not dc_cfg.get("enabled", True):
+        return filter_papers_batch(papers, compiled.keywords, compiled.exclude_keywords, compiled.required_keywords)
+    # Papers already classified under this keyword config (and unchanged) skip the regexes
+    cache = DecisionCache(
+        dc_cfg.get("dir", os.path.join("data", "decision_cache")),
+        compiled.config_hash,
+        float(dc_cfg.get("max_age_days", 30)),
+    )
+    return filter_papers_cached(
+        papers, compiled.keywords, compiled.exclude_keywords, compiled.required_keywords, cache
+    )
+
+
+def write_tweet_queue(path: str, papers: List[Paper], posted_path: str) -> int:
+    """Unposted paper IDs, newest first, for this profile's tweet job."""
+    try:
+        with open(posted_path, "r", encoding="utf-8") as f:
+            posted = set(json.load(f))
+    except (FileNotFoundError, ValueError):
+        posted = set()
+    queue = [p.id for p in papers if p.id not in posted]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(queue, f, indent=2)
+    return len(queue)
+
+
+def current_papers(cfg: Dict) -> List[Paper]:
+    """Every paper the profile has published, newest first.
+
+    Read from papers.json, or from the archive on a fresh checkout (papers.json
+    is not committed).
+    """
+    paths = output_paths(cfg)
+    if os.path.exists(paths["papers"]):
+        return list(iter_papers(paths["papers"]))
+    return list(iter_archive(paths["archive"], workers=4))
+
+
+def publish(papers: List[Paper], cfg: Dict, backfill: bool = False) -> bool:
+    """Merge ``papers`` into the profile's store; write papers.json, tweet queue, archive, delta, feed and pages.
+
+    The store keeps every paper published so far (backfills included), so
+    papers that fall out of the lookback window stay; ``papers`` add to it or
+    replace stored versions by ID. With ``backfill`` the batch is historical:
+    the tweet queue is left alone and the papers are not put in the feed as new.
+    The whole store is read, rescored and rewritten each time; only the archive
+    append is limited to new and changed papers. Returns False if nothing changed.
+    """
+    batch = dedupe_and_sort(papers)
+    paths = output_paths(cfg)
+    site_path = paths["papers"]
+    existed = os.path.exists(site_path)
+    previous = current_papers(cfg)
+    ids = {p.id for p in batch}
+    # Both sides are newest first, so this is a merge rather than a sort
+    final = list(merge_sorted([batch, (p for p in previous if p.id not in ids)]))
+    # Relevance score for ranking the site and tweet queue
+    # Same alias-expanded keywords the filter matched on, so alias-only matches score too
+    score_papers(final, compile_queries(cfg).keywords, cfg.get("keyword_weights"))
+
+    # Refreshed every run: the ledger changes as tweets go out even when papers do not
+    if not backfill:
+        queued = write_tweet_queue(paths["tweet_queue"], batch, paths["posted_ids"])
+        print(f"Tweet queue: {queued} unposted -> {paths['tweet_queue']}")
+
+    delta = compute_delta(previous, final)
+    # Write to site/data/papers.json (skipped when the content is identical)
+    changed = save_papers(site_path, final)
+    if changed and not existed:
+        changed = any(delta[k] for k in ("added", "updated", "removed"))
+    # Delta artifact for downstream consumers; written on every run (empty lists
+    # when nothing changed) since it is not committed and every deploy ships it
+    data_dir = os.path.dirname(site_path)
+    write_delta(os.path.join(data_dir, "delta.json"), delta)
+    if changed:
+        print(f"Wrote {len(final)} papers to {site_path}")
+        touched_ids = set(delta["added"]) | set(delta["updated"])
+        touched = append_to_archive(paths["archive"], [p for p in final if p.id in touched_ids], previous)
+        print(f"Archive: {touched} partition(s) updated under {paths['archive']}")
+
+        # Incremental feed
+        fresh = 0
+        if not backfill:
+            fresh = update_json_feed(
+                os.path.join(data_dir, "feed.json"), final, delta, home_page_url=cfg.get("site_url")
+            )
+        print(
+            f"Delta: added={len(delta['added'])} updated={len(delta['updated'])} "
+            f"removed={len(delta['removed'])}; feed items refreshed={fresh}"
+        )
+    else:
+        print(f"No changes; {site_path} left as is")
+
+    # Pre-render static pages; only pages whose content changed are rewritten.
+    # Pages are not committed, so this also runs when the data is unchanged.
+    if cfg.get("site_dir", "site"):
+        written, unchanged = build_site(final, cfg.get("site_dir", "site"))
+        print(f"Site pages: written={written} unchanged={unchanged}")
+    return changed
+
+
+def lookback_window(cfg: Dict) -> Tuple[datetime, datetime]:
+    lookback_days = int(cfg.get("lookback_days", 7))
+    now = datetime.now(timezone.utc)
+    return now - timedelta(days=lookback_days), now
+
+
+def fetch_all(cfg: Dict) -> Iterator[Paper]:
+    """Default fetch stage: every enabled source over the lookback window."""
+    start_date, now = lookback_window(cfg)
+    counts = {name: 0 for name in SOURCE_NAMES}
+    for name in enabled_sources(cfg):
+        fetched = fetch_source(name, cfg, start_date, now)
+        counts[name] = len(fetched)
+        yield from fetched
+
+    # Diagnostics
+    print(
+        "Sources fetched counts:",
+        *[f"{SOURCE_LABELS[n]}={counts[n]}" for n in SOURCE_NAMES],
+        f"total_raw={sum(counts.values())}",
+    )
+
+
+def run_profiles(
+    config: Union[str, Dict],
+    fetch: Optional[Fetch] = None,
+    filter: Optional[Filter] = None,
+    dedupe: Optional[Dedupe] = None,
+    sinks: Sequence[Sink] = (),
+    profiles: Optional[Sequence[str]] = None,
+) -> Dict[str, List[Paper]]:
+    """Fetch once and run every profile (or the named ``profiles``) on the result.
+
+    Returns the final papers per profile, newest first, after passing each
+    list to every sink.
+    """
+    cfg = load_config(config)
+    profs = profile_configs(cfg)
+    if profiles is not None:
+        unknown = set(profiles) - set(profs)
+        if unknown:
+            raise ValueError(f"unknown profiles: {sorted(unknown)}")
+        profs = {name: profs[name] for name in profiles}
+
+    papers = list((fetch or fetch_all)(fetch_config(cfg, profs)))
+    enrich(papers, cfg)
+
+    out: Dict[str, List[Paper]] = {}
+    for name, filtered in fan_out(papers, profs, filter or select_relevant).items():
+        final = (dedupe or dedupe_and_sort)(filtered)
+        print(f"[{name}] After filtering: kept={len(final)} of {len(papers)}")
+        for sink in sinks:
+            sink(final, profs[name])
+        out[name] = final
+    return out
+
+
+def run(
+    config: Union[str, Dict],
+    profile: str = DEFAULT_PROFILE,
+    fetch: Optional[Fetch] = None,
+    filter: Optional[Filter] = None,
+    dedupe: Optional[Dedupe] = None,
+    sinks: Sequence[Sink] = (),
+) -> Iterator[Paper]:
+    """Relevant papers for one profile, newest first.
+
+    ``config`` is a path to config.yaml or an already-loaded dict. The stages
+    run when iteration starts, and the whole batch is fetched, filtered and
+    de-duplicated before the first paper is yielded (newest-first order needs
+    every source). Pass ``sinks=[publish]`` to also write the profile's
+    outputs like ``update_papers.py`` does.
+    """
+    yield from run_profiles(config, fetch, filter, dedupe, sinks, profiles=[profile])[profile]
+
+
+def watch(config: Union[str, Dict], max_polls: Optional[int] = None, sinks: Sequence[Sink] = (publish,)) -> None:
+    """Long-running mode: poll each source on its own interval, publish only on change.
+
+    HTTP sessions and the in-memory index of current papers (one per profile)
+    are kept between polls, so a poll costs one fetch for the due source and
+    the sinks run only for profiles that gained a new or changed paper.
+    """
+    import requests
+
+    cfg = load_config(config)
+
+    intervals = {**DEFAULT_WATCH_MINUTES, **((cfg.get("watch") or {}).get("intervals_minutes") or {})}
+    names = enabled_sources(cfg)
+    sessions = {name: requests.Session() for name in names}
+    next_due = {name: 0.0 for name in names}
+    profiles = profile_configs(cfg)
+    fetch_cfg = fetch_config(cfg, profiles)
+
+    start_date, _ = lookback_window(cfg)
+    indexes: Dict[str, Dict[str, Paper]] = {
+        prof: {p.id: p for p in current_papers(pcfg) if p.published >= start_date}
+        for prof, pcfg in profiles.items()
+    }
+    print(
+        f"Watching {', '.join(SOURCE_LABELS[n] for n in names)}; "
+        + ", ".join(f"{prof}: {len(index)} papers in window" for prof, index in indexes.items())
+    )
+
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            name = min(next_due, key=next_due.get)
+            delay = next_due[name] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_due[name] = time.monotonic() + float(intervals.get(name, 120)) * 60
+            polls += 1
+
+            start_date, now = lookback_window(cfg)
+            fetched = fetch_source(name, fetch_cfg, start_date, now, sessions[name])
+            enrich(fetched, cfg)
+            for prof, relevant in fan_out(fetched, profiles, select_relevant).items():
+                index = indexes[prof]
+                fresh = [p for p in relevant if p.id not in index or paper_hash(index[p.id]) != paper_hash(p)]
+                # Papers age out of the lookback window as time passes, but only once their own
+                # source stops returning them: a source can keep returning papers dated before
+                # the window (PubMed year-only dates become Jan 1), which would otherwise be
+                # dropped by every other source's poll and come back as "new" on the next one
+                returned = {p.id for p in relevant}
+                expired = [
+                    pid
+                    for pid, p in index.items()
+                    if p.published < start_date and p.source == SOURCE_LABELS[name] and pid not in returned
+                ]
+                for pid in expired:
+                    del index[pid]
+                print(
+                    f"[{datetime.now(timezone.utc):%Y-%m-%d %H:%M}] [{prof}] {SOURCE_LABELS[name]}: "
+                    f"{len(relevant)} relevant, {len(fresh)} new/changed"
+                )
+                # Expired papers stay in the published store, so only new/changed ones need the sinks
+                if not fresh:
+                    continue
+                for p in fresh:
+                    index[p.id] = p
+                for sink in sinks:
+                    sink(list(index.values()), profiles[prof])
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        for s in sessions.values():
+            s.close()
@@ -0,0 +1,94 @@
+import copy
+import os
+from typing import Dict, List, Sequence
+
+from .models import Paper
+from .query import compile_queries
+
+DEFAULT_PROFILE = "default"
+
+# Settings a profile may override; everything else (sources, enrichment, ...) is shared
+PROFILE_KEYS = (
+    "keywords",
+    "keyword_aliases",
+    "keyword_weights",
+    "exclude_keywords",
+    "required_keywords",
+    "site_data_path",
+    "site_dir",
+    "site_url",
+    "tweet_queue_path",
+    "posted_ids_path",
+    "archive_dir",
+)
+
+
+def profile_configs(cfg: Dict) -> Dict[str, Dict]:
+    """Effective config per profile, keyed by profile name.
+
+    The top-level settings form the ``default`` profile (which keeps the
+    existing output paths). Each entry under ``profiles:`` inherits the shared
+    settings and gets its own outputs under ``site/data/profiles/<name>/``,
+    ``data/posted/<name>.json`` and ``data/profiles/<name>/archive/`` unless it
+    sets those paths itself. Only profiles
+    that set ``site_dir`` get pre-rendered pages.
+    """
+    out: Dict[str, Dict] = {}
+    if not (cfg.get("profiles") or {}).get(DEFAULT_PROFILE, {}).get("disabled"):
+        out[DEFAULT_PROFILE] = {k: v for k, v in cfg.items() if k != "profiles"}
+    for name, overrides in (cfg.get("profiles") or {}).items():
+        if name == DEFAULT_PROFILE:
+            continue
+        overrides = overrides or {}
+        unknown = set(overrides) - set(PROFILE_KEYS)
+        if unknown:
+            raise ValueError(f"profile {name!r}: unsupported settings {sorted(unknown)}")
+        prof = {k: v for k, v in cfg.items() if k not in PROFILE_KEYS and k != "profiles"}
+        prof["site_data_path"] = os.path.join("site", "data", "profiles", name, "papers.json")
+        prof["posted_ids_path"] = os.path.join("data", "posted", f"{name}.json")
+        prof["archive_dir"] = os.path.join("data", "profiles", name, "archive")
+        prof["site_dir"] = None
+        prof.update(overrides)
+        out[name] = prof
+    return out
+
+
+def output_paths(cfg: Dict) -> Dict[str, str]:
+    """Papers JSON, tweet queue, posted ledger and archive paths for one profile config."""
+    papers = cfg.get("site_data_path") or os.path.join("site", "data", "papers.json")
+    return {
+        "papers": papers,
+        "tweet_queue": cfg.get("tweet_queue_path") or os.path.join(os.path.dirname(papers), "tweet_queue.json"),
+        "posted_ids": cfg.get("posted_ids_path") or os.path.join("data", "posted_ids.json"),
+        "archive": cfg.get("archive_dir") or os.path.join("data", "archive"),
+    }
+
+
+def fetch_config(cfg: Dict, profiles: Dict[str, Dict]) -> Dict:
+    """Config for the shared fetch: the union of every profile's source queries.
+
+    Exclude/required terms differ between profiles, so with more than one
+    profile they are left to each profile's local filter instead of the
+    upstream query.
+    """
+    if len(profiles) == 1:
+        return next(iter(profiles.values()))
+    keywords: List[str] = []
+    for prof in profiles.values():
+        for k in compile_queries(prof).keywords:
+            if k.lower() not in {x.lower() for x in keywords}:
+                keywords.append(k)
+    return {**cfg, "keywords": keywords, "keyword_aliases": {}, "exclude_keywords": [], "required_keywords": []}
+
+
+def fan_out(papers: Sequence[Paper], profiles: Dict[str, Dict], select) -> Dict[str, List[Paper]]:
+    """Apply each profile's ``select(papers, cfg)`` filter to the shared stream.
+
+    Filtering and scoring set fields on the papers, so each profile after the
+    first works on shallow copies.
+    """
+    out: Dict[str, List[Paper]] = {}
+    for i, (name, prof) in enumerate(profiles.items()):
+        batch = list(papers) if i == 0 else [copy.copy(p) for p in papers]
+        out[name] = select(batch, prof)
+    return out
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from .filtering import compile_keyword_regex
+
+# Bump when the compiled output format or rules change so disk caches are invalidated
+COMPILER_VERSION = 1
+
+# Keep each request comfortably under the APIs' URL/query limits
+ARXIV_MAX_QUERY = 1000
+PUBMED_MAX_TERM = 2000
+CROSSREF_MAX_QUERY = 500
+
+# Common biological variants, used unless config.yaml sets keyword_aliases
+DEFAULT_ALIASES: Dict[str, List[str]] = {
+    "aging": ["aging", "ageing"],
+    "dna damage": ["dna damage", "dna repair", "double strand break", "dsb", "genotoxic"],
+    "ddr": ["ddr", "dna damage response", "damage response"],
+    "senescence": ["senescence", "cellular senescence", "senolytic", "senomorphic"],
+    "telomere": ["telomere", "telomerase", "telomeres"],
+}
+
+# Keyword (lowercase) -> MeSH heading; PubMed queries add these next to the [tiab] term
+MESH_TERMS: Dict[str, str] = {
+    "aging": "Aging",
+    "ageing": "Aging",
+    "dna damage": "DNA Damage",
+    "dna repair": "DNA Repair",
+    "senescence": "Cellular Senescence",
+    "cellular senescence": "Cellular Senescence",
+    "telomere": "Telomere",
+    "telomerase": "Telomerase",
+    "apoptosis": "Apoptosis",
+    "ferroptosis": "Ferroptosis",
+    "pyroptosis": "Pyroptosis",
+    "necroptosis": "Necroptosis",
+    "autophagy": "Autophagy",
+    "sirtuins": "Sirtuins",
+    "oxidative stress": "Oxidative Stress",
+    "reactive oxygen species": "Reactive Oxygen Species",
+    "caloric restriction": "Caloric Restriction",
+    "glycolysis": "Glycolysis",
+    "gluconeogenesis": "Gluconeogenesis",
+    "lipid metabolism": "Lipid Metabolism",
+    "energy metabolism": "Energy Metabolism",
+}
+
+
+def expand_keywords(keywords: Sequence[str], aliases: Optional[Dict[str, List[str]]] = None) -> List[str]:
+    """Keywords plus their alias variants, de-duplicated case-insensitively, order kept."""
+    aliases = DEFAULT_ALIASES if aliases is None else aliases
+    groups = [[base] + list(al) for base, al in aliases.items()]
+    out: List[str] = []
+    seen = set()
+
+    def add(term: str) -> None:
+        t = term.strip()
+        if t and t.lower() not in seen:
+            seen.add(t.lower())
+            out.append(t)
+
+    for k in keywords:
+        add(k)
+        lk = k.strip().lower()
+        for group in groups:
+            if lk in (g.lower() for g in group):
+                for a in group[1:]:
+                    add(a)
+    return out
+
+
+def pack_or_clauses(terms: Sequence[str], max_len: int, wrap: str = "({})") -> List[str]:
+    """Greedily pack terms into ``OR``-joined clauses whose wrapped length stays under ``max_len``."""
+    clauses: List[str] = []
+    current: List[str] = []
+    for t in terms:
+        candidate = current + [t]
+        if current and len(wrap.format(" OR ".join(candidate))) > max_len:
+            clauses.append(wrap.format(" OR ".join(current)))
+            current = [t]
+        else:
+            current = candidate
+    if current:
+        clauses.append(wrap.format(" OR ".join(current)))
+    return clauses
+
+
+def _arxiv_term(k: str) -> str:
+    k = k.replace('"', "")
+    return f'(ti:"{k}" OR abs:"{k}")'
+
+
+def _pubmed_terms(keywords: Sequence[str]) -> List[str]:
+    """``[tiab]`` term per keyword, then each mapped MeSH heading once."""
+    tiab = [f'"{k.replace(chr(34), "")}"[tiab]' for k in keywords]
+    mesh: List[str] = []
+    for k in keywords:
+        heading = MESH_TERMS.get(k.lower())
+        if heading and f'"{heading}"[mh]' not in mesh:
+            mesh.append(f'"{heading}"[mh]')
+    return tiab + mesh
+
+
+@dataclass
+class CompiledQueries:
+    """Source-native queries and keyword lists compiled from one config."""
+
+    config_hash: str
+    keywords: List[str]
+    exclude_keywords: List[str]
+    required_keywords: List[str]
+    # Keyword clauses; fetchers add categories and the date window
+    arxiv: List[str] = field(default_factory=list)
+    # Full PubMed term minus the date range
+    pubmed: List[str] = field(default_factory=list)
+    # Crossref query.bibliographic values
+    crossref: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.kw_regex: List[re.Pattern] = compile_keyword_regex(self.keywords)
+        self.excl_regex: List[re.Pattern] = compile_keyword_regex(self.exclude_keywords)
+        self.req_regex: List[re.Pattern] = compile_keyword_regex(self.required_keywords)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def config_hash(cfg: Dict) -> str:
+    relevant = {
+        "v": COMPILER_VERSION,
+        "keywords": cfg.get("keywords") or [],
+        "keyword_aliases": cfg.get("keyword_aliases"),
+        "exclude_keywords": cfg.get("exclude_keywords") or [],
+        "required_keywords": cfg.get("required_keywords") or [],
+    }
+    raw = json.dumps(relevant, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _compile(cfg: Dict, h: str) -> CompiledQueries:
+    keywords = expand_keywords(cfg.get("keywords") or [], cfg.get("keyword_aliases"))
+    exclude = [k for k in (cfg.get("exclude_keywords") or []) if k.strip()]
+    required = [k for k in (cfg.get("required_keywords") or []) if k.strip()]
+
+    arxiv_suffix = ""
+    if required:
+        arxiv_suffix += " AND " + "(" + " OR ".join(_arxiv_term(k) for k in required) + ")"
+    if exclude:
+        arxiv_suffix += " ANDNOT " + "(" + " OR ".join(_arxiv_term(k) for k in exclude) + ")"
+    arxiv = [
+        c + arxiv_suffix
+        for c in pack_or_clauses([_arxiv_term(k) for k in keywords], ARXIV_MAX_QUERY - len(arxiv_suffix))
+    ]
+
+    pubmed_suffix = ""
+    if required:
+        pubmed_suffix += " AND (" + " OR ".join(_pubmed_terms(required)) + ")"
+    if exclude:
+        pubmed_suffix += " NOT (" + " OR ".join(_pubmed_terms(exclude)) + ")"
+    pubmed = [
+        c + pubmed_suffix
+        for c in pack_or_clauses(_pubmed_terms(keywords), PUBMED_MAX_TERM - len(pubmed_suffix))
+    ]
+
+    # Crossref ranks free text rather than evaluating boolean syntax; plain terms only
+    crossref = pack_or_clauses([k.replace('"', "") for k in keywords], CROSSREF_MAX_QUERY, wrap="{}")
+    crossref = [c.replace(" OR ", " ") for c in crossref]
+
+    return CompiledQueries(h, keywords, exclude, required, arxiv, pubmed, crossref)
+
+
+_memo: Dict[str, CompiledQueries] = {}
+
+
+def compile_queries(cfg: Dict, cache_dir: Optional[str] = None) -> CompiledQueries:
+    """Compile (or fetch from cache) the queries and matchers for ``cfg``.
+
+    Results are memoized in-process by config hash, so the regexes are compiled
+    once per process (watch mode, backfill, profiles). The query strings are
+    also written to ``cache_dir`` (``query_cache_dir`` in config.yaml) and
+    reused by later runs with the same config.
+    """
+    h = config_hash(cfg)
+    if h in _memo:
+        return _memo[h]
+    cache_dir = cache_dir or cfg.get("query_cache_dir") or os.path.join("data", "query_cache")
+    path = os.path.join(cache_dir, f"{h}.json")
+    compiled = None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            compiled = CompiledQueries(**json.load(f))
+    except (FileNotFoundError, ValueError, TypeError):
+        pass
+    if compiled is None:
+        compiled = _compile(cfg, h)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(compiled.to_dict(), f, ensure_ascii=False, indent=2)
+        except OSError:
+            # Read-only checkouts still work, just without the disk cache
+            pass
+    _memo[h] = compiled
+    return compiled
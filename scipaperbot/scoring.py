@@ -0,0 +1,115 @@
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from .filtering import compile_keyword_regex
+from .models import Paper
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _keyword_table(keywords: Sequence[str], weights: Optional[Dict[str, float]]):
+    """Unique keyword patterns with their summed weights.
+
+    Spelling variants (e.g. Aging/Ageing) compile to the same pattern and share
+    one column of the term matrix.
+    """
+    import numpy as np
+
+    lower_weights = {k.lower(): float(v) for k, v in (weights or {}).items()}
+    table: Dict[str, float] = {}
+    for k in keywords:
+        for rx in compile_keyword_regex([k]):
+            table[rx.pattern] = table.get(rx.pattern, 0.0) + lower_weights.get(k.strip().lower(), 1.0)
+    pats = list(table)
+    return pats, np.array([table[p] for p in pats], dtype=np.float64)
+
+
+def bm25_scores(
+    papers: Sequence[Paper],
+    keywords: Sequence[str],
+    weights: Optional[Dict[str, float]] = None,
+    k1: float = 1.2,
+    b: float = 0.75,
+    title_boost: float = 2.0,
+) -> "np.ndarray":
+    """BM25 relevance of each paper's title + abstract against weighted keywords.
+
+    The whole batch is lowercased and joined into one string, and each keyword
+    pattern scans it once; match offsets are mapped back to documents with
+    ``searchsorted`` and the resulting sparse (doc, keyword) term-frequency
+    matrix is scored in one vectorized pass. Title hits count ``title_boost``
+    times. IDF is computed over the batch.
+    """
+    # numpy is only loaded when something is actually scored
+    import numpy as np
+
+    n = len(papers)
+    if n == 0 or not keywords:
+        return np.zeros(n, dtype=np.float64)
+    pats, kw_weights = _keyword_table(keywords, weights)
+
+    # Lowercase per field so offsets stay consistent if lowering changes lengths
+    titles = [(p.title or "").lower() for p in papers]
+    summaries = [(p.summary or "").lower() for p in papers]
+    lengths = np.fromiter((len(t) + len(s) + 2 for t, s in zip(titles, summaries)), dtype=np.int64, count=n)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    title_ends = starts + np.fromiter((len(t) for t in titles), dtype=np.int64, count=n)
+    # Document length in tokens, title tokens weighted like title hits
+    doc_len = np.fromiter(
+        (len(t.split()) * title_boost + len(s.split()) for t, s in zip(titles, summaries)),
+        dtype=np.float64,
+        count=n,
+    )
+
+    # Documents are separated by NUL, which ``\s`` does not match, so multi-word
+    # patterns like ``dna\s+damage`` cannot run from one paper into the next
+    blob = "\0".join(f"{t}\n{s}" for t, s in zip(titles, summaries))
+
+    def word_start(i: int) -> bool:
+        return i == 0 or not (blob[i - 1].isalnum() or blob[i - 1] == "_")
+
+    pos_parts, term_parts = [], []
+    for i, pat in enumerate(pats):
+        # A leading \b defeats the regex engine's literal-prefix search, so scan
+        # for the bare pattern and check the left boundary per hit instead
+        rx = re.compile(pat.lower().removeprefix(r"\b"))
+        hits = np.fromiter((m.start() for m in rx.finditer(blob) if word_start(m.start())), dtype=np.int64)
+        pos_parts.append(hits)
+        term_parts.append(np.full(len(hits), i, dtype=np.int64))
+    pos = np.concatenate(pos_parts)
+    if len(pos) == 0:
+        return np.zeros(n, dtype=np.float64)
+    term = np.concatenate(term_parts)
+    doc = np.searchsorted(starts, pos, side="right") - 1
+    hit_w = np.where(pos < title_ends[doc], title_boost, 1.0)
+
+    # Sparse term matrix in COO form: one entry per (doc, keyword) pair present
+    n_terms = len(pats)
+    cells, inverse = np.unique(doc * n_terms + term, return_inverse=True)
+    tf = np.bincount(inverse, weights=hit_w)
+    d = cells // n_terms
+    t = cells % n_terms
+
+    df = np.bincount(t, minlength=n_terms)
+    idf = np.log1p((n - df + 0.5) / (df + 0.5))
+    avgdl = max(float(doc_len.mean()), 1.0)
+    norm = k1 * (1.0 - b + b * doc_len[d] / avgdl)
+    contrib = kw_weights[t] * idf[t] * tf * (k1 + 1.0) / (tf + norm)
+    return np.bincount(d, weights=contrib, minlength=n)
+
+
+def score_papers(
+    papers: Sequence[Paper],
+    keywords: Sequence[str],
+    weights: Optional[Dict[str, float]] = None,
+) -> None:
+    """Compute BM25 scores for a batch and store them on ``Paper.score``."""
+    scores = bm25_scores(papers, keywords, weights)
+    for p, s in zip(papers, scores):
+        p.score = round(float(s), 4)
+
+
+def rank_by_score(papers: Sequence[Paper]) -> List[Paper]:
+    """Most relevant first; ties broken by newest."""
+    return sorted(papers, key=lambda p: (p.score, p.published), reverse=True)
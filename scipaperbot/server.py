@@ -0,0 +1,222 @@
+import bisect
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from dateutil import parser as dateparser
+
+from .enrich import normalize_doi
+from .models import Paper
+from .sitebuild import keyword_label
+from .storage import load_papers
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class PaperIndex:
+    """Immutable in-memory indexes over one version of the dataset."""
+
+    def __init__(self, papers: List[Paper], version: str) -> None:
+        self.version = version
+        # Newest first; ``_neg_epoch`` is ascending so bisect works for date ranges
+        self.papers = sorted(papers, key=lambda p: p.published, reverse=True)
+        self._neg_epoch = [-p.published.replace(tzinfo=timezone.utc).timestamp() for p in self.papers]
+        self.by_id: Dict[str, int] = {}
+        self.by_doi: Dict[str, int] = {}
+        self.by_source: Dict[str, List[int]] = {}
+        self.by_keyword: Dict[str, List[int]] = {}
+        self._text: List[str] = []
+        for i, p in enumerate(self.papers):
+            self.by_id[p.id] = i
+            doi = normalize_doi(p.doi)
+            if doi:
+                self.by_doi[doi] = i
+            self.by_source.setdefault(p.source.lower(), []).append(i)
+            for label in {keyword_label(k).lower() for k in p.keywords_matched}:
+                self.by_keyword.setdefault(label, []).append(i)
+            self._text.append(f"{p.title}\n{p.summary}".lower())
+
+    def _date_range(self, since: Optional[datetime], until: Optional[datetime]) -> range:
+        lo = bisect.bisect_left(self._neg_epoch, -until.timestamp()) if until else 0
+        hi = bisect.bisect_right(self._neg_epoch, -since.timestamp()) if since else len(self.papers)
+        return range(lo, hi)
+
+    def query(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        source: Optional[str] = None,
+        keyword: Optional[str] = None,
+        q: Optional[str] = None,
+        doi: Optional[str] = None,
+    ) -> List[int]:
+        """Indices of matching papers, newest first."""
+        if doi:
+            i = self.by_doi.get(normalize_doi(doi) or "")
+            candidates = [i] if i is not None else []
+        else:
+            candidates = None
+        for key, table in ((source, self.by_source), (keyword, self.by_keyword)):
+            if key:
+                hits = table.get(key.lower(), [])
+                candidates = hits if candidates is None else sorted(set(candidates) & set(hits))
+        window = self._date_range(since, until)
+        if candidates is None:
+            candidates = window
+        else:
+            candidates = [i for i in candidates if window.start <= i < window.stop]
+        if q:
+            needle = q.lower()
+            candidates = [i for i in candidates if needle in self._text[i]]
+        return list(candidates)
+
+
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class PaperStore:
+    """Holds the current ``PaperIndex`` and swaps in a new one when the file changes.
+
+    Requests read ``self.index`` once, so a reload never blocks or mixes versions.
+    """
+
+    def __init__(self, path: str, poll_seconds: float = 5.0) -> None:
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._stamp: Optional[Tuple[int, int]] = None
+        self.index = PaperIndex([], "empty")
+        self.reload()
+
+    def reload(self) -> bool:
+        stamp = _file_version(self.path)
+        if stamp == self._stamp:
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                version = hashlib.sha256(f.read()).hexdigest()[:16]
+        except FileNotFoundError:
+            version = "empty"
+        if version != self.index.version:
+            self.index = PaperIndex(load_papers(self.path), version)
+            print(f"Loaded {len(self.index.papers)} papers (version {version})")
+        self._stamp = stamp
+        return True
+
+    def watch(self) -> threading.Thread:
+        def loop() -> None:
+            while True:
+                time.sleep(self.poll_seconds)
+                try:
+                    self.reload()
+                except Exception as e:
+                    # Keep serving the previous version (e.g. file caught mid-write)
+                    print(f"[WARN] reload failed: {e}")
+
+        t = threading.Thread(target=loop, daemon=True)
+        t.start()
+        return t
+
+
+def _parse_date(s: Optional[str]) -> Optional[datetime]:
+    if not s:
+        return None
+    dt = dateparser.parse(s)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def make_handler(store: PaperStore):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "scipaperbot"
+
+        def _send_json(self, status: int, body: Dict, etag: Optional[str] = None) -> None:
+            raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(raw)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def _not_modified(self, etag: str) -> bool:
+            inm = self.headers.get("If-None-Match", "")
+            if etag in [t.strip() for t in inm.split(",")]:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return True
+            return False
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            qs = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            index = store.index
+            # Responses only depend on the dataset version and the query string
+            etag = '"' + hashlib.sha256(f"{index.version}?{url.path}?{url.query}".encode()).hexdigest()[:20] + '"'
+
+            if url.path == "/health":
+                self._send_json(200, {"status": "ok", "version": index.version, "papers": len(index.papers)})
+                return
+            if url.path == "/paper":
+                i = index.by_id.get(qs.get("id", ""))
+                if i is None:
+                    self._send_json(404, {"error": "not found"})
+                    return
+                if not self._not_modified(etag):
+                    self._send_json(200, index.papers[i].to_dict(), etag)
+                return
+            if url.path != "/papers":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            try:
+                since = _parse_date(qs.get("since"))
+                until = _parse_date(qs.get("until"))
+                limit = min(max(int(qs.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+                offset = max(int(qs.get("offset", 0)), 0)
+            except (ValueError, OverflowError) as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            if self._not_modified(etag):
+                return
+            hits = index.query(since, until, qs.get("source"), qs.get("keyword"), qs.get("q"), qs.get("doi"))
+            self._send_json(
+                200,
+                {
+                    "version": index.version,
+                    "total": len(hits),
+                    "offset": offset,
+                    "limit": limit,
+                    "items": [index.papers[i].to_dict() for i in hits[offset : offset + limit]],
+                },
+                etag,
+            )
+
+    return Handler
+
+
+def serve(path: str, host: str = "127.0.0.1", port: int = 8000, poll_seconds: float = 5.0) -> None:
+    store = PaperStore(path, poll_seconds)
+    store.watch()
+    httpd = ThreadingHTTPServer((host, port), make_handler(store))
+    print(f"Serving {path} on http://{host}:{port}/papers")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import re
+from html import escape
+from string import Template
+from typing import Dict, List, Sequence, Tuple
+
+from .models import Paper
+
+SOURCES = ["arXiv", "bioRxiv", "medRxiv", "PubMed", "ChemRxiv"]
+PAGE_SIZE = 50
+MAX_PAGES = 20
+MANIFEST = ".pages-manifest.json"
+SITE_TITLE = "Aging & DDR Papers"
+
+
+def _slug(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
+
+
+def keyword_label(k: str) -> str:
+    """Readable form of a ``keywords_matched`` regex source, e.g. ``\\b(?:aging|ageing)\\b`` -> ``aging``."""
+    s = re.sub(r"\(\?:[^()]*\)\?", "", k)  # drop optional suffixes
+    s = s.replace("\\s+", " ").replace("\\b", "")
+    s = re.sub(r"\(\?:([^|()]*)[^()]*\)", r"\1", s)  # first alternative
+    return s.replace("\\", "")
+
+
+def render_item(p: Paper) -> str:
+    """One list card; keep in sync with render() in site/app.js."""
+    kw = " ".join(f'<span class="badge">{escape(keyword_label(k))}</span>' for k in p.keywords_matched)
+    return (
+        '<li class="card">'
+        f'<div class="meta"><span class="badge">{escape(p.source)}</span><span>{p.published:%Y-%m-%d}</span></div>'
+        f'<h3><a href="{escape(p.link)}" target="_blank" rel="noopener">{escape(p.title)}</a></h3>'
+        f'<div class="summary">{escape(", ".join(p.authors))}</div>'
+        f"<div>{kw}</div>"
+        "</li>"
+    )
+
+
+def _page_name(prefix: str, n: int) -> str:
+    # n == 0 is the front page: index.html for the main listing, source/<slug>.html per source.
+    # Older pages are numbered from the oldest paper up, so adding new papers
+    # does not renumber (and rewrite) them.
+    if n == 0:
+        return "index.html" if not prefix else f"{prefix}.html"
+    return f"page/{n}.html" if not prefix else f"{prefix}-{n}.html"
+
+
+def _pager(prefix: str, n: int, first: int, last: int, root: str) -> str:
+    links = []
+    if n:
+        newer = n + 1 if n < last else 0
+        links.append(f'<a href="{root}{_page_name(prefix, newer)}">&larr; Newer</a>')
+        links.append(f"<span>Page {n}</span>")
+    older = n - 1 if n else last
+    if older >= first:
+        links.append(f'<a href="{root}{_page_name(prefix, older)}">Older &rarr;</a>')
+    return " ".join(links)
+
+
+def render_pages(
+    papers: Sequence[Paper], template: str, page_size: int = PAGE_SIZE, max_pages: int = MAX_PAGES
+) -> Dict[str, str]:
+    """Render the newest papers and numbered older pages, for everything and for each source.
+
+    Returns {path relative to the site dir: html}. Papers are expected newest first.
+    Only the newest ``max_pages`` numbered pages are rendered; older papers are
+    still in papers.json for the search.
+    """
+    tpl = Template(template)
+    groups: List[Tuple[str, str, Sequence[Paper]]] = [("", "", papers)]
+    for src in SOURCES:
+        subset = [p for p in papers if p.source == src]
+        if subset:
+            groups.append((f"source/{_slug(src)}", src, subset))
+
+    pages: Dict[str, str] = {}
+    for prefix, src, items in groups:
+        m = len(items)
+        # Numbered pages hold papers [(n - 1) * page_size, n * page_size) counted
+        # from the oldest; pages wholly inside the front page are not rendered
+        last = (m - 1 - page_size) // page_size + 1 if m > page_size else 0
+        first = max(1, last - max_pages + 1)
+        numbered = range(first, last + 1) if last else range(0)
+        for n in [0, *numbered]:
+            name = _page_name(prefix, n)
+            root = "../" * name.count("/")
+            options = "\n".join(
+                f'      <option{" selected" if s == src else ""}>{escape(s)}</option>' for s in SOURCES
+            )
+            if n:
+                chunk = items[max(0, m - n * page_size) : m - (n - 1) * page_size]
+            else:
+                chunk = items[:page_size]
+            title = SITE_TITLE if not src else f"{src} – {SITE_TITLE}"
+            if n:
+                title = f"{title} (page {n})"
+            pages[name] = tpl.safe_substitute(
+                title=escape(title),
+                root=root,
+                source_options=options,
+                items="\n".join(f"      {render_item(p)}" for p in chunk),
+                pager=_pager(prefix, n, first, last, root),
+            )
+    return pages
+
+
+def build_site(
+    papers: Sequence[Paper],
+    site_dir: str = "site",
+    template_path: str = "",
+    page_size: int = PAGE_SIZE,
+    max_pages: int = MAX_PAGES,
+) -> Tuple[int, int]:
+    """Pre-render pages into ``site_dir``, writing only pages whose content hash changed.
+
+    Pages that existed in the previous build but are no longer produced are
+    removed. Returns (pages written, pages unchanged).
+    """
+    template_path = template_path or os.path.join(site_dir, "template.html")
+    with open(template_path, "r", encoding="utf-8") as f:
+        template = f.read()
+    pages = render_pages(papers, template, page_size, max_pages)
+
+    manifest_path = os.path.join(site_dir, MANIFEST)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous: Dict[str, str] = json.load(f)
+    except (FileNotFoundError, ValueError):
+        previous = {}
+
+    current: Dict[str, str] = {}
+    written = unchanged = 0
+    for name, html in pages.items():
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        current[name] = digest
+        path = os.path.join(site_dir, name)
+        if previous.get(name) == digest and os.path.exists(path):
+            unchanged += 1
+            continue
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        written += 1
+
+    for name in previous:
+        if name not in current:
+            try:
+                os.remove(os.path.join(site_dir, name))
+            except FileNotFoundError:
+                pass
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2, sort_keys=True)
+    return written, unchanged
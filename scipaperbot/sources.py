@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .filtering import BIO_HEURISTIC
+from .models import Paper
+from .query import compile_queries
+
+# Order matters for logs/diagnostics only
+SOURCE_NAMES = ["arxiv", "biorxiv", "medrxiv", "pubmed", "chemrxiv"]
+
+SOURCE_LABELS = {
+    "arxiv": "arXiv",
+    "biorxiv": "bioRxiv",
+    "medrxiv": "medRxiv",
+    "pubmed": "PubMed",
+    "chemrxiv": "ChemRxiv",
+}
+
+# Per-request result caps for a regular lookback-window run
+DEFAULT_MAX_RESULTS: Dict[str, int] = {
+    "arxiv": 200,
+    "biorxiv": 1000,
+    "medrxiv": 1000,
+    "pubmed": 200,
+    "chemrxiv": 200,
+}
+
+
+def enabled_sources(cfg: Dict) -> List[str]:
+    src_cfg = cfg.get("sources", {})
+    # medRxiv is opt-in, everything else opt-out
+    return [n for n in SOURCE_NAMES if src_cfg.get(n, {}).get("enabled", n != "medrxiv")]
+
+
+Fetch = Callable[[datetime, datetime], List[Paper]]
+
+
+def _rate_limited(fetch: Fetch, limiter) -> Fetch:
+    if limiter is None:
+        return fetch
+
+    def limited(s: datetime, e: datetime) -> List[Paper]:
+        limiter.wait()
+        return fetch(s, e)
+
+    return limited
+
+
+def source_fetcher(
+    name: str,
+    cfg: Dict,
+    max_results: Optional[int] = None,
+    session=None,
+    limiter=None,
+) -> Fetch:
+    """A ``fetch(start, end)`` callable for one source, configured from ``cfg``.
+
+    Fetcher modules are imported lazily so callers only pay for the sources
+    they use. ``session`` (a requests.Session) is reused across calls.
+    ``limiter`` (anything with a ``wait()`` method) is waited on before each
+    call; arXiv and PubMed, which send several requests per call (one per
+    query clause, plus PubMed's esummary), wait on it before every request
+    instead.
+    """
+    compiled = compile_queries(cfg)
+    keywords = compiled.keywords
+    src_cfg = cfg.get("sources", {}).get(name, {})
+    limit = max_results or DEFAULT_MAX_RESULTS[name]
+
+    if name == "arxiv":
+        from .fetchers.arxiv import fetch_arxiv
+
+        categories = src_cfg.get("categories", ["q-bio*", "cs.CB"])
+        return lambda s, e: fetch_arxiv(
+            keywords, s, e, limit, categories, session=session, queries=compiled.arxiv, limiter=limiter
+        )
+    if name in ("biorxiv", "medrxiv"):
+        from .fetchers.biorxiv import fetch_rxiv
+
+        return _rate_limited(lambda s, e: fetch_rxiv(name, s, e, limit, session=session), limiter)
+    if name == "pubmed":
+        from .fetchers.pubmed import fetch_pubmed
+
+        return lambda s, e: fetch_pubmed(
+            keywords, s, e, limit, src_cfg.get("email"), session=session, terms=compiled.pubmed, limiter=limiter
+        )
+    if name == "chemrxiv":
+        from .fetchers.chemrxiv import fetch_chemrxiv
+
+        bio_only = src_cfg.get("bio_only", True)
+
+        def matches(text: str) -> bool:
+            return any(rx.search(text) for rx in compiled.kw_regex)
+
+        def fetch(s: datetime, e: datetime) -> List[Paper]:
+            chem = fetch_chemrxiv(
+                keywords, s, e, limit, session=session, bibliographic=compiled.crossref, matcher=matches
+            )
+            if bio_only:
+                chem = [p for p in chem if BIO_HEURISTIC.search((p.title + "\n" + p.summary))]
+            return chem
+
+        return _rate_limited(fetch, limiter)
+    raise ValueError(f"Unknown source: {name}")
@@ -1,27 +1,465 @@
+import glob
+import hashlib
+import heapq
 import json
 import os
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from .authors import AuthorTable
 from .models import Paper
 
+if TYPE_CHECKING:
+    import numpy as np
+
+COMPACT_FORMAT = "scipaperbot-compact/1"
+
+
+def compact_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".compact.json"
+
+
+def papers_to_compact(papers: Iterable[Paper]) -> Dict:
+    """Compact form: the author table once, each paper's ``authors`` as indices into it."""
+    table = AuthorTable()
+    rows = []
+    for p in papers:
+        d = p.to_dict()
+        d["authors"] = table.encode(p.authors)
+        rows.append(d)
+    return {"format": COMPACT_FORMAT, "authors": table.names, "papers": rows}
+
+
+def papers_from_compact(data: Dict) -> List[Paper]:
+    names = data["authors"]
+    return [Paper.from_dict({**d, "authors": [names[i] for i in d["authors"]]}) for d in data["papers"]]
+
 
 def load_papers(path: str) -> List[Paper]:
+    """Papers from a JSON list or a compact file (see ``papers_to_compact``)."""
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        return [Paper.from_dict(x) for x in data]
     except FileNotFoundError:
         return []
+    if isinstance(data, dict) and data.get("format") == COMPACT_FORMAT:
+        return papers_from_compact(data)
+    return [Paper.from_dict(x) for x in data]
+
+
+def _write_if_changed(path: str, payload: bytes) -> bool:
+    try:
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(payload).digest():
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(payload)
+    return True
+
+
+def save_papers(path: str, papers: List[Paper], snapshot: bool = True, compact: bool = True) -> bool:
+    """Write ``papers`` as JSON; returns False (and leaves the file untouched) if nothing changed.
+
+    With ``compact`` a ``.compact.json`` sidecar (author table + per-paper
+    author IDs, no indentation) is written too; the site loads that one.
+    """
+    payload = json.dumps([p.to_dict() for p in papers], ensure_ascii=False, indent=2).encode("utf-8")
+    changed = _write_if_changed(path, payload)
+    if compact:
+        # Checked even when the JSON is unchanged so a missing sidecar gets created
+        raw = json.dumps(papers_to_compact(papers), ensure_ascii=False, separators=(",", ":"))
+        _write_if_changed(compact_path(path), raw.encode("utf-8"))
+    if snapshot and (changed or not _snapshot_current(path)):
+        # Also rebuilt when missing (e.g. a fresh checkout) or written from an older JSON
+        write_snapshot(snapshot_path(path), papers, source_path=path)
+    return changed
+
+
+def _published(p: Paper) -> datetime:
+    return p.published
+
+
+def newest_first(papers: Iterable[Paper]) -> List[Paper]:
+    """``papers`` sorted newest first; already-sorted input is returned without re-sorting."""
+    papers = list(papers)
+    if all(papers[i].published >= papers[i + 1].published for i in range(len(papers) - 1)):
+        return papers
+    return sorted(papers, key=_published, reverse=True)
+
+
+def merge_sorted(streams: Iterable[Iterable[Paper]], limit: Optional[int] = None) -> Iterator[Paper]:
+    """Heap-based k-way merge of newest-first streams, de-duplicated by ID.
+
+    Every stream must already be sorted newest first (the stored archive is,
+    per-source batches can go through ``newest_first``). The first occurrence
+    of an ID is its newest version and wins; for equal dates the earlier stream
+    wins. Items are pulled lazily, so with ``limit`` only about ``limit`` items
+    per stream are read, and the merge itself never materializes the output.
+    """
+    seen = set()
+    merged = heapq.merge(*streams, key=_published, reverse=True)
+    out = (p for p in merged if not (p.id in seen or seen.add(p.id)))
+    return islice(out, limit) if limit is not None else out
+
+
+def dedupe_and_sort(papers: Iterable[Paper]) -> List[Paper]:
+    """Newest first, one paper per ID, merging each source's batch as its own stream.
+
+    Batches that are already newest first (arXiv, ChemRxiv) pass through
+    ``newest_first`` without a sort; the others are sorted per source before
+    the heap merge.
+    """
+    by_source: Dict[str, List[Paper]] = {}
+    for p in papers:
+        by_source.setdefault(p.source, []).append(p)
+    return list(merge_sorted([newest_first(batch) for batch in by_source.values()]))
+
+
+def iter_papers(path: str) -> Iterator[Paper]:
+    """Stored papers from ``path``, newest first, decoded lazily from the snapshot when current."""
+    snap = load_snapshot(snapshot_path(path))
+    if snap is not None and snap.is_current(path):
+        return snap.iter_newest()
+    return iter(newest_first(load_papers(path)))
+
+
+# Columnar snapshot
+#
+# A single binary file next to papers.json that can be memory-mapped:
+#   magic (8 bytes) | header length (uint64) | JSON header | padding | arrays
+# Rows are sorted by ``published`` ascending. Arrays: published (int64 epoch
+# seconds), source (uint8 code into header["sources"]), offsets (int64, n+1)
+# into blob (uint8, one compact JSON record per row). Range and source queries
+# are a binary search plus a vectorized mask; only matching rows are decoded.
+# numpy is imported by the snapshot functions themselves, not at module load.
+
+SNAPSHOT_MAGIC = b"SPBSNAP1"
+_ALIGN = 8
+
+
+# Snapshots are a local cache, kept out of site/ so Pages does not publish them
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+
+def snapshot_path(path: str) -> str:
+    """Snapshot file for the JSON at ``path``, under ``SNAPSHOT_DIR``."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    key = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=6).hexdigest()
+    return os.path.join(SNAPSHOT_DIR, f"{name}-{key}.snap")
+
+
+def _epoch(dt: datetime) -> int:
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _source_stamp(path: Optional[str]) -> Optional[Dict[str, int]]:
+    if not path:
+        return None
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def write_snapshot(path: str, papers: Iterable[Paper], source_path: Optional[str] = None) -> None:
+    import numpy as np
 
+    # Reverse first so that reading newest-first keeps ties in their original order
+    rows = sorted(list(papers)[::-1], key=lambda p: p.published)
+    sources = sorted({p.source for p in rows})
+    if len(sources) > 255:
+        raise ValueError("snapshot supports at most 255 distinct sources")
+    code = {s: i for i, s in enumerate(sources)}
 
-def save_papers(path: str, papers: List[Paper]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([p.to_dict() for p in papers], f, ensure_ascii=False, indent=2)
+    records = [json.dumps(p.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8") for p in rows]
+    arrays = {
+        "published": np.array([_epoch(p.published) for p in rows], dtype=np.int64),
+        "source": np.array([code[p.source] for p in rows], dtype=np.uint8),
+        "offsets": np.concatenate(([0], np.cumsum([len(r) for r in records], dtype=np.int64))).astype(np.int64),
+        "blob": np.frombuffer(b"".join(records), dtype=np.uint8),
+    }
 
+    # Array offsets are relative to the (aligned) start of the data section
+    layout = {}
+    pos = 0
+    for name, arr in arrays.items():
+        layout[name] = {"dtype": arr.dtype.str, "offset": pos, "count": int(arr.size)}
+        pos += -(-arr.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps(
+        {"n": len(rows), "sources": sources, "arrays": layout, "source_file": _source_stamp(source_path)}
+    ).encode("utf-8")
+    prefix = len(SNAPSHOT_MAGIC) + 8 + len(header)
+    data_start = -(-prefix // _ALIGN) * _ALIGN
 
-def dedupe_and_sort(papers: List[Paper]) -> List[Paper]:
-    seen = {}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        f.write(b"\0" * (data_start - prefix))
+        for name, arr in arrays.items():
+            f.write(arr.tobytes())
+            f.write(b"\0" * (-arr.nbytes % _ALIGN))
+    os.replace(tmp, path)
+
+
+class PaperSnapshot:
+    """Memory-mapped, read-only view of a snapshot written by ``write_snapshot``."""
+
+    def __init__(self, path: str) -> None:
+        import numpy as np
+
+        self.path = path
+        mm = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(mm[: len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a paper snapshot")
+        hlen = int(mm[8:16].view(np.uint64)[0])
+        self.header = json.loads(bytes(mm[16 : 16 + hlen]).decode("utf-8"))
+        data_start = -(-(16 + hlen) // _ALIGN) * _ALIGN
+        self._mm = mm
+        cols = {}
+        for name, spec in self.header["arrays"].items():
+            dt = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            cols[name] = mm[start : start + spec["count"] * dt.itemsize].view(dt)
+        self.published = cols["published"]
+        self.source = cols["source"]
+        self.offsets = cols["offsets"]
+        self.blob = cols["blob"]
+        self.sources: List[str] = self.header["sources"]
+
+    def __len__(self) -> int:
+        return int(self.header["n"])
+
+    def is_current(self, source_path: str) -> bool:
+        """True if the snapshot was written from ``source_path`` as it is now on disk."""
+        try:
+            return self.header.get("source_file") == _source_stamp(source_path)
+        except FileNotFoundError:
+            return False
+
+    def select(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+    ) -> "np.ndarray":
+        """Row indices (ascending by date) with since <= published <= until and a matching source."""
+        import numpy as np
+
+        lo = int(np.searchsorted(self.published, _epoch(since), side="left")) if since else 0
+        hi = int(np.searchsorted(self.published, _epoch(until), side="right")) if until else len(self)
+        idx = np.arange(lo, hi)
+        if sources is not None:
+            codes = [self.sources.index(s) for s in sources if s in self.sources]
+            idx = idx[np.isin(self.source[lo:hi], codes)]
+        return idx
+
+    def paper(self, i: int) -> Paper:
+        raw = bytes(self.blob[self.offsets[i] : self.offsets[i + 1]])
+        return Paper.from_dict(json.loads(raw.decode("utf-8")))
+
+    def iter_newest(self) -> Iterator[Paper]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self.paper(i)
+
+    def query(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+    ) -> List[Paper]:
+        """Matching papers, newest first."""
+        return [self.paper(int(i)) for i in self.select(since, until, sources)[::-1]]
+
+
+def load_snapshot(path: str) -> Optional[PaperSnapshot]:
+    try:
+        return PaperSnapshot(path)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _snapshot_current(path: str) -> bool:
+    snap = load_snapshot(snapshot_path(path))
+    return snap is not None and snap.is_current(path)
+
+
+def query_papers(
+    path: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    sources: Optional[Iterable[str]] = None,
+) -> List[Paper]:
+    """Papers from ``path`` in a date/source range, newest first.
+
+    Uses the columnar snapshot when it is current, otherwise falls back to
+    parsing the JSON.
+    """
+    snap = load_snapshot(snapshot_path(path))
+    if snap is not None and snap.is_current(path):
+        return snap.query(since, until, sources)
+    wanted = set(sources) if sources is not None else None
+    out = []
+    for p in load_papers(path):
+        if since and p.published < since:
+            continue
+        if until and p.published > until:
+            continue
+        if wanted is not None and p.source not in wanted:
+            continue
+        out.append(p)
+    return sorted(out, key=lambda p: p.published, reverse=True)
+
+
+# Month-partitioned JSON Lines archive
+#
+# ``root/YYYY/YYYY-MM.jsonl`` holds one compact JSON record per line for the
+# papers published in that month, so a daily commit touches one small file
+# instead of a rewritten papers.json. New records are appended; a changed
+# record rewrites only its own partition (and the one it left, if its month
+# changed). ``score`` is not stored because it is re-derived for every batch.
+
+
+def partition_path(root: str, published: datetime) -> str:
+    return os.path.join(root, f"{published:%Y}", f"{published:%Y-%m}.jsonl")
+
+
+def list_partitions(root: str) -> List[str]:
+    """Partition files under ``root``, newest month first."""
+    return sorted(glob.glob(os.path.join(root, "[0-9][0-9][0-9][0-9]", "*.jsonl")), reverse=True)
+
+
+def _archive_record(p: Paper) -> str:
+    d = p.to_dict()
+    d.pop("score", None)
+    return json.dumps(d, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _read_lines(path: str) -> Dict[str, str]:
+    """{paper id: record line} for one partition, in file order."""
+    out: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    out[json.loads(line)["id"]] = line
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def append_to_archive(root: str, papers: Iterable[Paper], previous: Iterable[Paper] = ()) -> int:
+    """Add new/changed ``papers`` to the archive at ``root``; returns partitions written.
+
+    ``previous`` are the stored versions of these papers; a paper whose
+    publication month differs from its previous version is removed from the
+    old month's partition.
+    """
+    groups: Dict[str, List[Paper]] = {}
     for p in papers:
-        if p.id not in seen or (seen[p.id].published < p.published):
-            seen[p.id] = p
-    return sorted(seen.values(), key=lambda p: p.published, reverse=True)
+        groups.setdefault(partition_path(root, p.published), []).append(p)
+    old_paths = {p.id: partition_path(root, p.published) for p in previous}
+    moved: Dict[str, set] = {}
+    for path, batch in groups.items():
+        for p in batch:
+            old = old_paths.get(p.id)
+            if old is not None and old != path:
+                moved.setdefault(old, set()).add(p.id)
+
+    touched = 0
+    for path in sorted(set(groups) | set(moved)):
+        lines = _read_lines(path)
+        added: List[str] = []
+        rewrite = False
+        for pid in moved.get(path, ()):
+            if lines.pop(pid, None) is not None:
+                rewrite = True
+        for p in groups.get(path, ()):
+            rec = _archive_record(p)
+            old = lines.get(p.id)
+            if old == rec:
+                continue
+            if old is None:
+                added.append(rec)
+            else:
+                rewrite = True
+            lines[p.id] = rec
+        if not added and not rewrite:
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if rewrite and not lines:
+            os.remove(path)
+        elif rewrite:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(line + "\n" for line in lines.values())
+            os.replace(tmp, path)
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(line + "\n" for line in added)
+        touched += 1
+    return touched
+
+
+def read_partition(path: str) -> List[Paper]:
+    """Papers of one partition, newest first."""
+    with open(path, "r", encoding="utf-8") as f:
+        return newest_first(Paper.from_dict(json.loads(line)) for line in f if line.strip())
+
+
+def iter_archive(
+    root: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    workers: int = 1,
+) -> Iterator[Paper]:
+    """Stream archived papers newest first, reading only partitions that overlap the range.
+
+    Partitions are read lazily; with ``workers`` > 1 the next few are read and
+    decoded in a thread pool while the current one is consumed. Partitions are
+    disjoint months, so the stream is globally newest first and can feed
+    ``merge_sorted``. An ID found in more than one month (left behind by an
+    archive written before moved papers were cleaned up) is yielded once,
+    from the newest month.
+    """
+    parts = []
+    for path in list_partitions(root):
+        month = os.path.basename(path)[:7]
+        if since and month < f"{since:%Y-%m}":
+            continue
+        if until and month > f"{until:%Y-%m}":
+            continue
+        parts.append(path)
+
+    def batches() -> Iterator[List[Paper]]:
+        if workers <= 1:
+            for path in parts:
+                yield read_partition(path)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            pending: deque = deque()
+            for path in parts:
+                pending.append(ex.submit(read_partition, path))
+                # Bounded read-ahead keeps memory flat for large archives
+                if len(pending) > workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    seen = set()
+    for batch in batches():
+        for p in batch:
+            if since and p.published < since:
+                continue
+            if until and p.published > until:
+                continue
+            if p.id not in seen:
+                seen.add(p.id)
+                yield p
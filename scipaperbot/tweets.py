@@ -0,0 +1,186 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from time import sleep
+from typing import Dict, List, Optional, Union
+
+from .models import Paper
+from .pipeline import load_config
+from .profiles import DEFAULT_PROFILE, output_paths, profile_configs
+from .scoring import rank_by_score
+from .storage import iter_archive, query_papers
+
+
+def compose_hashtags(p: Paper, max_hashtags: int = 4) -> List[str]:
+    mapping = {
+        "aging": "#aging",
+        "ageing": "#aging",
+        "dna damage": "#DNAdamage",
+        "ddr": "#DDR",
+        "senescence": "#senescence",
+        "telomere": "#telomere",
+        "telomerase": "#telomerase",
+        "cell death": "#CellDeath",
+        "apoptosis": "#apoptosis",
+        "ferroptosis": "#ferroptosis",
+        "pyroptosis": "#pyroptosis",
+        "necroptosis": "#necroptosis",
+        "autophagy": "#autophagy",
+        "mtor": "#mTOR",
+        "ampk": "#AMPK",
+        "sirtuin": "#sirtuins",
+        "nad+": "#NAD",
+        "p53": "#p53",
+        "mitochondria": "#mitochondria",
+        "metabolism": "#metabolism",
+        "oxidative stress": "#oxidativestress",
+        "ros": "#ROS",
+    }
+    tags = []
+    text = (p.title + "\n" + p.summary).lower()
+    for key, tag in mapping.items():
+        if key in text and tag not in tags:
+            tags.append(tag)
+        if len(tags) >= max_hashtags:
+            break
+    if not tags:
+        tags = ["#biology"]
+    return tags[:max_hashtags]
+
+
+def truncate_to_limit(text: str, limit: int = 280) -> str:
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1] + "…"
+
+
+def compose_tweet(p: Paper) -> str:
+    tags = compose_hashtags(p)
+    base = f"{p.title.strip()}\n{p.link}"
+    tag_str = " ".join(tags)
+    remaining = 280 - len(base) - 1
+    if remaining > 10 and tag_str:
+        text = f"{base} {tag_str}"
+    else:
+        text = base
+    return truncate_to_limit(text)
+
+
+def _read_queue(path: str) -> Optional[List[str]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return list(json.load(f))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def post_papers(
+    config: Union[str, Dict],
+    profile: str = DEFAULT_PROFILE,
+    source: Optional[str] = None,
+    max_age_days: int = 30,
+    dry_run: bool = False,
+    max_tweets: int = 1,
+    order: str = "newest",
+    min_interval_sec: float = 2.0,
+) -> int:
+    """Tweet up to ``max_tweets`` unposted papers of ``profile``; returns how many were posted.
+
+    Candidates are the profile's tweet queue (written by ``pipeline.publish``)
+    limited to ``max_age_days`` and ``source``, newest first or by relevance
+    score with ``order="relevance"``; posted papers are taken off the queue.
+    Runs dry (prints instead of posting) when ``dry_run`` is set or the
+    config's ``twitter`` section is disabled or in dry-run mode.
+    """
+    from .twitter import TwitterClient
+
+    profiles = profile_configs(load_config(config))
+    if profile not in profiles:
+        raise ValueError(f"unknown profile {profile!r}; available: {', '.join(profiles)}")
+    cfg = profiles[profile]
+    paths = output_paths(cfg)
+
+    papers_path = paths["papers"]
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    # Date/source selection runs against the columnar snapshot when available
+    if os.path.exists(papers_path):
+        newer = query_papers(papers_path, since=cutoff, sources=[source] if source else None)
+        print(f"Loaded {len(newer)} papers from {papers_path}")
+    else:
+        # papers.json is not committed; without an update run first, read the archive
+        newer = [p for p in iter_archive(paths["archive"], since=cutoff) if not source or p.source == source]
+        print(f"Loaded {len(newer)} papers from {paths['archive']}")
+
+    posted_state_path = paths["posted_ids"]
+    os.makedirs(os.path.dirname(posted_state_path) or ".", exist_ok=True)
+    try:
+        with open(posted_state_path, "r", encoding="utf-8") as f:
+            posted_ids = set(json.load(f))
+    except FileNotFoundError:
+        posted_ids = set()
+
+    # Candidates come from the queue the last update run wrote (newest first);
+    # without one, every unposted paper in the date/source window
+    queue_path = paths["tweet_queue"]
+    queue = _read_queue(queue_path)
+    if queue is not None:
+        by_id = {p.id: p for p in newer}
+        unposted = [by_id[pid] for pid in queue if pid in by_id and pid not in posted_ids]
+        print(f"Tweet queue: {len(queue)} queued in {queue_path}")
+    else:
+        unposted = [p for p in newer if p.id not in posted_ids]
+    if order == "relevance":
+        unposted = rank_by_score(unposted)
+    print(
+        f"Eligible after filters -> newer_than={max_age_days}d: {len(newer)}, unposted: {len(unposted)}, source={'any' if not source else source}"
+    )
+    if not unposted:
+        print("No candidate paper found to post.")
+        return 0
+
+    tw_enabled = bool(cfg.get("twitter", {}).get("enabled", False))
+    dry_run = dry_run or (not tw_enabled) or bool(cfg.get("twitter", {}).get("dry_run", True))
+
+    client = TwitterClient()
+    try:
+        mode = client.get_mode()
+    except Exception:
+        mode = "unknown"
+    print(f"Auth mode: {mode}")
+    handle = client.verify()
+    if handle:
+        print(f"Twitter auth OK as @{handle}")
+    else:
+        print("Twitter auth NOT verified (will still print tweet for dry-run)")
+
+    posted_count = 0
+    for idx, candidate in enumerate(unposted[: max(1, max_tweets)]):
+        tweet_text = compose_tweet(candidate)
+        print(f"\n[{idx+1}] Selected candidate:", candidate.title)
+        print("Link:", candidate.link)
+
+        url = client.post(tweet_text, dry_run=dry_run)
+        if dry_run:
+            print("[DRY-RUN] Would post:")
+            print(tweet_text)
+        else:
+            if url:
+                print(f"Posted: {url}")
+                posted_ids.add(candidate.id)
+                with open(posted_state_path, "w", encoding="utf-8") as f:
+                    json.dump(sorted(list(posted_ids)), f, indent=2)
+                if queue is not None:
+                    # Keep the committed queue in step with the ledger
+                    queue = [pid for pid in queue if pid != candidate.id]
+                    with open(queue_path, "w", encoding="utf-8") as f:
+                        json.dump(queue, f, indent=2)
+                posted_count += 1
+            else:
+                print("Tweet not sent: missing/invalid Twitter credentials or API failure.")
+
+        # polite spacing between tweets
+        if idx + 1 < min(len(unposted), max_tweets):
+            sleep(max(0.0, min_interval_sec))
+
+    print(f"\nCompleted tweeting: attempted={min(len(unposted), max_tweets)}; succeeded={posted_count}; dry_run={dry_run}")
+    return posted_count
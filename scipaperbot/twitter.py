@@ -1,9 +1,11 @@
 import base64
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import requests
-import tweepy
+
+if TYPE_CHECKING:
+    import tweepy
 
 
 class TwitterClient:
@@ -33,7 +35,7 @@ class TwitterClient:
         self.refresh_token = os.getenv("TWITTER_REFRESH_TOKEN")
         self._oauth2_access_token: Optional[str] = None
 
-        self.client: Optional[tweepy.Client] = None
+        self.client: Optional["tweepy.Client"] = None
         self._username: Optional[str] = None
 
         # Prefer OAuth2 if creds exist, else fallback to OAuth1 via Tweepy Client
@@ -45,6 +47,9 @@ class TwitterClient:
     def _auth_oauth1(self) -> None:
         if not all([self.consumer_key, self.consumer_secret, self.access_token, self.access_token_secret]):
             return
+        # Imported here: only the OAuth1 fallback needs tweepy
+        import tweepy
+
         self.client = tweepy.Client(
             consumer_key=self.consumer_key,
             consumer_secret=self.consumer_secret,
@@ -103,6 +108,8 @@ class TwitterClient:
         # Fallback to Tweepy Client (OAuth1 in v2 client)
         if not self.client:
             return None
+        import tweepy
+
         try:
             me = self.client.get_me()
             if me and me.data and hasattr(me.data, "username"):
@@ -148,6 +155,8 @@ class TwitterClient:
         # Fallback: Tweepy v2 client with OAuth1 creds
         if not self.client:
             return None
+        import tweepy
+
         try:
             resp = self.client.create_tweet(text=text)
             if not resp or not resp.data or "id" not in resp.data:
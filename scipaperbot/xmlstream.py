@@ -0,0 +1,71 @@
+import io
+import re
+from datetime import datetime, timezone
+from typing import IO, Iterator, Optional, Union
+
+try:
+    from lxml import etree as _etree
+
+    HAVE_LXML = True
+except ImportError:  # lxml is optional; the stdlib parser is used otherwise
+    import xml.etree.ElementTree as _etree
+
+    HAVE_LXML = False
+
+from .models import Paper
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+_WS = re.compile(r"\s+")
+
+
+def iter_elements(source: Union[bytes, IO[bytes]], tag: str) -> Iterator:
+    """Yield each ``tag`` element as soon as its end tag is parsed.
+
+    Elements are cleared after the consumer is done with them, so memory stays
+    flat however large the document is. Uses lxml when installed.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    for _, elem in _etree.iterparse(source, events=("end",)):
+        if elem.tag != tag:
+            continue
+        yield elem
+        elem.clear()
+        if HAVE_LXML:
+            # lxml keeps references from the parent; drop already-handled siblings
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _text(elem, path: str) -> str:
+    return _WS.sub(" ", elem.findtext(path) or "").strip()
+
+
+def _parse_atom_date(s: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(s.strip().replace("Z", "+00:00")).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def parse_arxiv_feed(source: Union[bytes, IO[bytes]]) -> Iterator[Paper]:
+    """Papers from an arXiv API Atom response, yielded entry by entry."""
+    for e in iter_elements(source, f"{ATOM}entry"):
+        link = ""
+        for ln in e.iterfind(f"{ATOM}link"):
+            if ln.get("rel", "alternate") == "alternate":
+                link = ln.get("href", "")
+                break
+        yield Paper(
+            id=_text(e, f"{ATOM}id") or link,
+            title=_text(e, f"{ATOM}title"),
+            authors=[_text(a, f"{ATOM}name") for a in e.iterfind(f"{ATOM}author")],
+            summary=(e.findtext(f"{ATOM}summary") or "").strip(),
+            published=_parse_atom_date(e.findtext(f"{ATOM}published") or "") or datetime.now(timezone.utc),
+            updated=None,
+            source="arXiv",
+            link=link,
+            doi=None,
+            categories=[c.get("term", "") for c in e.iterfind(f"{ATOM}category")],
+        )
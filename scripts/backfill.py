@@ -0,0 +1,50 @@
+import argparse
+import os
+from datetime import datetime, timezone
+
+from scipaperbot.backfill import run_backfill
+from scipaperbot.pipeline import load_config, publish
+from scipaperbot.sources import SOURCE_NAMES
+
+
+def parse_date(s: str) -> datetime:
+    return datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Backfill papers over a long date range in resumable chunks")
+    ap.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    ap.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
+    ap.add_argument("--end", default=None, help="End date (YYYY-MM-DD), defaults to now")
+    ap.add_argument(
+        "--sources",
+        default=None,
+        help=f"Comma-separated subset of {','.join(SOURCE_NAMES)} (defaults to enabled sources)",
+    )
+    ap.add_argument("--checkpoint-dir", default=None, help="Where finished chunks are stored (default data/backfill)")
+    ap.add_argument("--no-merge", action="store_true", help="Only fetch/checkpoint; do not update the paper store")
+    args = ap.parse_args()
+
+    cfg = load_config(args.config)
+    start = parse_date(args.start)
+    end = parse_date(args.end).replace(hour=23, minute=59, second=59) if args.end else datetime.now(timezone.utc)
+    sources = [s.strip().lower() for s in args.sources.split(",")] if args.sources else None
+    unknown = sorted(set(sources or []) - set(SOURCE_NAMES))
+    if unknown:
+        ap.error(f"unknown sources: {', '.join(unknown)} (choose from {', '.join(SOURCE_NAMES)})")
+    checkpoint_dir = args.checkpoint_dir or (cfg.get("backfill") or {}).get(
+        "checkpoint_dir", os.path.join("data", "backfill")
+    )
+
+    fetched = run_backfill(cfg, start, end, sources=sources, checkpoint_dir=checkpoint_dir)
+    print(f"Backfill collected {len(fetched)} relevant papers for {start:%Y-%m-%d}..{end:%Y-%m-%d}")
+    if args.no_merge:
+        return
+
+    # Merged into the store and archived like a daily run, but kept out of the
+    # tweet queue and the feed: these papers are not new
+    publish(fetched, cfg, backfill=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from scipaperbot.xmlstream import HAVE_LXML, parse_arxiv_feed
+
+WORDS = "aging senescence dna damage repair telomere mitochondrial stress cell mouse human model network".split()
+
+
+def synthetic_feed(n: int, seed: int = 0) -> bytes:
+    """An arXiv API-shaped Atom feed with ``n`` entries."""
+    rng = random.Random(seed)
+    base = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    entries = []
+    for i in range(n):
+        pub = (base - timedelta(minutes=37 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        title = " ".join(rng.choices(WORDS, k=10))
+        summary = " ".join(rng.choices(WORDS, k=180))
+        authors = "".join(
+            f"<author><name>Author {rng.randrange(5000)}</name></author>" for _ in range(rng.randrange(1, 12))
+        )
+        entries.append(
+            f"""<entry>
+    <id>http://arxiv.org/abs/2406.{i:05d}v1</id>
+    <updated>{pub}</updated>
+    <published>{pub}</published>
+    <title>{title[:60]}
+  {title[60:]}</title>
+    <summary>  {summary}
+</summary>
+    {authors}
+    <link href="http://arxiv.org/abs/2406.{i:05d}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2406.{i:05d}v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="q-bio.CB" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="q-bio.CB" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="q-bio.MN" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        "  <title>ArXiv Query</title>\n  " + "\n  ".join(entries) + "\n</feed>\n"
+    ).encode("utf-8")
+
+
+def parse_with_feedparser(data: bytes):
+    """What fetch_arxiv used to do: feedparser, then pick the fields we keep."""
+    import feedparser
+
+    out = []
+    for e in feedparser.parse(data).entries:
+        out.append(
+            (
+                e.id,
+                " ".join(e.title.split()),
+                [a.name for a in e.authors],
+                [t.term for t in e.tags],
+                datetime(*e.published_parsed[:6], tzinfo=timezone.utc),
+                e.link,
+            )
+        )
+    return out
+
+
+def parse_streaming(data: bytes):
+    return [(p.id, p.title, p.authors, p.categories, p.published, p.link) for p in parse_arxiv_feed(data)]
+
+
+def best_of(fn, data: bytes, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn(data)
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark the streaming arXiv parser against feedparser")
+    ap.add_argument("--entries", type=int, default=2000, help="Entries in the synthetic feed")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per parser (best time is reported)")
+    args = ap.parse_args()
+
+    data = synthetic_feed(args.entries)
+    backend = "lxml" if HAVE_LXML else "ElementTree"
+    print(f"Feed: {args.entries} entries, {len(data) / 1e6:.1f} MB; streaming backend: {backend}")
+
+    fast = best_of(parse_streaming, data, args.repeat)
+    print(f"streaming:  {fast:.3f}s")
+    try:
+        slow = best_of(parse_with_feedparser, data, args.repeat)
+    except ImportError:
+        print("feedparser not installed (pip install feedparser) - skipping comparison")
+        return
+    print(f"feedparser: {slow:.3f}s  ({slow / fast:.1f}x slower)")
+
+    same = parse_streaming(data) == parse_with_feedparser(data)
+    print(f"Same fields from both parsers: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+import os
+
+from scipaperbot.pipeline import load_config
+from scipaperbot.sitebuild import MAX_PAGES, PAGE_SIZE, build_site
+from scipaperbot.storage import load_papers
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Pre-render the static site pages from papers.json")
+    ap.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    ap.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Papers per page")
+    ap.add_argument("--max-pages", type=int, default=MAX_PAGES, help="Older pages rendered per listing")
+    args = ap.parse_args()
+
+    cfg = load_config(args.config)
+    site_path = cfg.get("site_data_path", os.path.join("site", "data", "papers.json"))
+    site_dir = cfg.get("site_dir", "site")
+
+    papers = load_papers(site_path)
+    written, unchanged = build_site(papers, site_dir, page_size=args.page_size, max_pages=args.max_pages)
+    print(f"Site pages: written={written} unchanged={unchanged} ({len(papers)} papers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import argparse
+import os
+
+from scipaperbot.pipeline import load_config
+from scipaperbot.server import serve
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Serve a read-only query API over papers.json")
+    ap.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--poll-seconds", type=float, default=5.0, help="How often to check papers.json for changes")
+    args = ap.parse_args()
+
+    cfg = load_config(args.config)
+    site_path = cfg.get("site_data_path", os.path.join("site", "data", "papers.json"))
+    serve(site_path, args.host, args.port, args.poll_seconds)
+
+
+if __name__ == "__main__":
+    main()
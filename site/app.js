@@ -1,9 +1,29 @@
+const ROOT = document.body.dataset.root || '';
+
 async function load() {
-  const res = await fetch('data/papers.json');
-  const items = await res.json();
-  return items;
+  // The compact sidecar lists each author once; papers refer to them by index
+  let res = await fetch(ROOT + 'data/papers.compact.json');
+  if (!res.ok) res = await fetch(ROOT + 'data/papers.json');
+  const data = await res.json();
+  if (Array.isArray(data)) return data;
+  return data.papers.map(p => ({ ...p, authors: p.authors.map(i => data.authors[i]) }));
+}
+
+function escapeHtml(s) {
+  return String(s ?? '').replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' }[c]));
+}
+
+// Readable form of a keywords_matched regex; mirrors keyword_label() in sitebuild.py
+function keywordLabel(k) {
+  return k
+    .replace(/\(\?:[^()]*\)\?/g, '')
+    .replace(/\\s\+/g, ' ')
+    .replace(/\\b/g, '')
+    .replace(/\(\?:([^|()]*)[^()]*\)/g, '$1')
+    .replace(/\\/g, '');
 }
 
+// Keep markup in sync with render_item() in scipaperbot/sitebuild.py
 function render(items) {
   const list = document.getElementById('list');
   list.innerHTML = '';
@@ -13,14 +33,14 @@ function render(items) {
     const date = new Date(p.published);
     const dateStr = date.toISOString().slice(0, 10);
     const authors = (p.authors || []).join(', ');
-    const kw = (p.keywords_matched || []).map(k => `<span class="badge">${k.replace(/\\b/g, '')}</span>`).join(' ');
+    const kw = (p.keywords_matched || []).map(k => `<span class="badge">${escapeHtml(keywordLabel(k))}</span>`).join(' ');
     li.innerHTML = `
       <div class="meta">
-        <span class="badge">${p.source}</span>
+        <span class="badge">${escapeHtml(p.source)}</span>
         <span>${dateStr}</span>
       </div>
-      <h3><a href="${p.link}" target="_blank" rel="noopener">${p.title}</a></h3>
-      <div class="summary">${authors}</div>
+      <h3><a href="${escapeHtml(p.link)}" target="_blank" rel="noopener">${escapeHtml(p.title)}</a></h3>
+      <div class="summary">${escapeHtml(authors)}</div>
       <div>${kw}</div>
     `;
     list.appendChild(li);
@@ -30,15 +50,25 @@ function render(items) {
 function applyFilters(all) {
   const q = document.getElementById('search').value.trim().toLowerCase();
   const src = document.getElementById('source').value;
+  const sort = document.getElementById('sort').value;
   let items = all;
   if (src) items = items.filter(p => p.source === src);
   if (q) items = items.filter(p => (p.title + '\n' + (p.summary||'')).toLowerCase().includes(q));
+  if (sort === 'relevance') items = [...items].sort((a, b) => (b.score || 0) - (a.score || 0));
+  // Filtered views list every match, so the static pager no longer applies
+  const pager = document.getElementById('pager');
+  if (pager) pager.hidden = true;
   render(items);
 }
 
 (async function() {
-  const all = await load();
-  render(all);
-  document.getElementById('search').addEventListener('input', () => applyFilters(all));
-  document.getElementById('source').addEventListener('change', () => applyFilters(all));
+  // Pre-rendered pages already show their papers; the JSON is only fetched
+  // once the reader starts filtering or sorting.
+  let all = null;
+  const getAll = async () => all || (all = await load());
+  const update = async () => applyFilters(await getAll());
+  if (!document.getElementById('list').children.length) render(await getAll());
+  document.getElementById('search').addEventListener('input', update);
+  document.getElementById('source').addEventListener('change', update);
+  document.getElementById('sort').addEventListener('change', update);
 })();